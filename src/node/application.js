@@ -9,6 +9,7 @@ const { requestHandler } = require('./middleware/request-handler');
 const { errorHandler } = require('./middleware/error-handler');
 
 const { pingV1Controller } = require('./controllers/ping.v1.controller');
+const { metricsV1Controller } = require('./controllers/metrics.v1.controller');
 const { pynodeBridgeV1Controller } = require('./controllers/pynode-bridge.v1.controller');
 
 const { FileUtilities } = require('./common/file-utilities');
@@ -51,6 +52,8 @@ const configureApplication = application => {
   //#region Controllers
   // adds ping controller...
   pingV1Controller.bindToExpressApplication(application, '/ping', '1.0');
+  // adds metrics controller...
+  metricsV1Controller.bindToExpressApplication(application, '/metrics', '1.0');
   // adds pynode bridge controller...
   pynodeBridgeV1Controller.bindToExpressApplication(application, '/pynode-bridge', '1.0');
   //#endregion
@@ -71,9 +74,18 @@ const createDirectoriesAsync = async () => {
 
 //#region Process Events
 
+let isProcessExiting = false;
+
 const onProcessExited = () => {
+  // this method may be invoked more than once (e.g. by signal and then by exit event)...
+  if (isProcessExiting) { return; }
+
+  isProcessExiting = true;
+
   logger.warning('Process is closing...');
 
+  // writes pending application state changes to file system...
+  ApplicationStateService.getInstance().flush();
   // destroys pynode bridge service instance...
   pynodeBridgeService.destroy();
   // closes http server...
@@ -82,13 +94,26 @@ const onProcessExited = () => {
   logger.warning('Process closed successfully...');
 };
 
+const onProcessSignalReceived = () => {
+  onProcessExited();
+  process.exit();
+};
+
 // this event occurs when application exits...
-process.on('exit', () => onProcessExited);
+process.on('exit', onProcessExited);
 // this event occurs when Ctrl+C is pressed...
-process.on('SIGINT', () => onProcessExited);
+process.on('SIGINT', onProcessSignalReceived);
 // these events occur when process is killed (e.g. nodemon restart)...
-process.on('SIGUSR1', () => onProcessExited);
-process.on('SIGUSR2', () => onProcessExited);
+process.on('SIGUSR1', onProcessSignalReceived);
+process.on('SIGUSR2', onProcessSignalReceived);
+// this event is used to reload python scripts without dropping requests...
+process.on('SIGHUP', () => {
+  logger.information('Restarting python loader...');
+
+  pynodeBridgeService.restartAsync()
+    .then(() => logger.information('Python loader has been restarted successfully.'))
+    .catch(error => logger.error('An error occurred while restarting python loader.', error));
+});
 // this event occurs when exception is uncaught...
 process.on('uncaughtException', () => onProcessExited);
 // this event occurs on unhandled promise rejection...
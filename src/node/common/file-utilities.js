@@ -130,4 +130,61 @@ module.exports.FileUtilities = class FileUtilities {
 
     await asyncFileSystem.writeFile(filePath, contents, { encoding: 'utf-8', flag: flag, });
   }
+
+  /**
+   * Writes data to a temporary file and renames it to the destination
+   * so that readers never observe a partially written file.
+   * @async
+   * @param {String} filePath 
+   * @param {String | any} data 
+   */
+  static async writeFileAtomicallyAsync(filePath, data) {
+    const temporaryFilePath = FileUtilities.prepareTemporaryFilePath(filePath);
+
+    try {
+      await FileUtilities.writeFileAsync(temporaryFilePath, data);
+      await asyncFileSystem.rename(temporaryFilePath, filePath);
+    } catch (error) {
+      await asyncFileSystem.rm(temporaryFilePath, { force: true, });
+
+      throw error;
+    }
+  }
+
+  /**
+   * Synchronous version of writeFileAtomicallyAsync() which is
+   * meant to be used where asynchronous operations cannot complete
+   * (e.g. while the process is exiting).
+   * @param {String} filePath 
+   * @param {String | any} data 
+   */
+  static writeFileAtomically(filePath, data) {
+    const temporaryFilePath = FileUtilities.prepareTemporaryFilePath(filePath);
+    let contents = data;
+
+    // checks if data is an object (array is also an object)...
+    if (typeof contents === 'object') {
+      contents = JsonSerializer.serialize(data, 2, true);
+    }
+
+    try {
+      fileSystem.writeFileSync(temporaryFilePath, contents, { encoding: 'utf-8', });
+      fileSystem.renameSync(temporaryFilePath, filePath);
+    } catch (error) {
+      fileSystem.rmSync(temporaryFilePath, { force: true, });
+
+      throw error;
+    }
+  }
+
+  /**
+   * @param {String} filePath 
+   * @returns {String} 
+   */
+  static prepareTemporaryFilePath(filePath) {
+    // temporary file must be on the same file system as the destination for rename to be atomic...
+    return `${filePath}.${process.pid}.${FileUtilities.temporaryFileCount++}.tmp`;
+  }
+
+  static temporaryFileCount = 0;
 };
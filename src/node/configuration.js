@@ -11,6 +11,18 @@ const configuration = {
   staticFilesDirectory: './application-data/wwwroot',
   applicationState: {
     dataFilePath: './application-data/application-state.json',
+    flushInterval: 1000,                // coalesced changes are written after 1 second...
+    maxPendingChanges: 100,             // or, as soon as 100 changes are pending...
+  },
+  uids: {
+    reservationSize: 1000,              // number of UIDs reserved at once...
+  },
+  pythonLoader: {
+    workers: {
+      maxTaskCount: 1000,               // workers are recycled after executing 1000 tasks...
+      maxTaskCountJitter: 100,          // plus up to 100 tasks so that workers are not recycled together...
+      maxResidentSetSize: 536870912,    // or, as soon as their resident set size exceeds 512 MB...
+    },
   },
   uploads: {
     directoryPath: './application-data/uploads',
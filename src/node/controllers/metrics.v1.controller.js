@@ -0,0 +1,28 @@
+const { ControllerBase } = require('../core/controller-base');
+const { MetricsService } = require('../services/metrics.service');
+const { PyNodeBridgeService } = require('../services/pynode-bridge.service');
+
+class MetricsV1Controller extends ControllerBase {
+
+  async getMetricsAsync() {
+    // retrieves the latest counters from python loader...
+    await this.pynodeBridgeService.collectMetricsAsync();
+
+    return {
+      status: 200,
+      contentType: 'text/plain; version=0.0.4',
+      content: this.metricsService.toPrometheusText(),
+    };
+  }
+
+  configure(router) {
+    // retrieves the instance of pynode bridge service...
+    this.pynodeBridgeService = PyNodeBridgeService.getInstance();
+    // retrieves the instance of metrics service...
+    this.metricsService = MetricsService.getInstance();
+
+    router.addRoute('GET', '/', this.getMetricsAsync.bind(this));
+  }
+}
+
+module.exports.metricsV1Controller = new MetricsV1Controller();
@@ -33,12 +33,24 @@ class PyNodeBridgeV1Controller extends ControllerBase {
     };
   }
 
+  async restartAsync() {
+    // replaces python loader without dropping requests...
+    await this.pynodeBridgeService.restartAsync();
+
+    return {
+      status: 200,
+      message: 'Python loader has been restarted successfully.',
+      data: { processId: this.pynodeBridgeService.getProcessId(), },
+    };
+  }
+
   configure(router) {
     // retrieves the instance of pynode bridge service...
     this.pynodeBridgeService = PyNodeBridgeService.getInstance();
     // retrieves the instance of file upload service...
     this.fileUploadService = FileUploadService.getInstance();
 
+    router.addRoute('POST', '/restart', this.restartAsync.bind(this));
     router.addRoute('POST', '/:module/:function', this.getResponseFromPythonAsync.bind(this));
   }
 }
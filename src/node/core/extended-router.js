@@ -51,6 +51,10 @@ module.exports.ExtendedRouter = class ExtendedRouter {
           return response.status(result.status ?? 200).sendFile(result.filePath);
         }
 
+        if (typeof result.content === 'string') {
+          return response.status(result.status ?? 200).type(result.contentType ?? 'text/plain').send(result.content);
+        }
+
         const apiResponse = new ApiResponse();
         apiResponse.status = result.status ?? apiResponse.status;
         apiResponse.message = result.message ?? apiResponse.message;
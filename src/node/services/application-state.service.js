@@ -8,6 +8,14 @@ module.exports.ApplicationStateService = class ApplicationStateService {
     this.logger = new Logger(ApplicationStateService.name);
     this.dataFilePath = ApplicationStateService.prepareDataFilePath();
     this.data = {};
+    // total number of changes and the number of changes written to file system...
+    this.changeCount = 0;
+    this.savedChangeCount = 0;
+    this.pendingChangeCount = 0;
+    this.flushTimeout = undefined;
+    // writes are chained on this promise so that they never interleave...
+    this.lastSavePromise = Promise.resolve(true);
+    this.queuedSavePromise = undefined;
   }
 
   async loadAsync() {
@@ -28,9 +36,65 @@ module.exports.ApplicationStateService = class ApplicationStateService {
     return true;
   }
 
-  async saveAsync() {
+  /**
+   * Saves application state to file system. Saves requested while
+   * another save is in progress are coalesced into a single write.
+   * @returns {Promise<Boolean>} 
+   */
+  saveAsync() {
+    // a save that has not started yet shall also write the latest changes...
+    if (this.queuedSavePromise) { return this.queuedSavePromise; }
+
+    const savePromise = this.lastSavePromise.then(() => {
+      this.queuedSavePromise = undefined;
+
+      return this.writeAsync();
+    });
+
+    this.queuedSavePromise = savePromise;
+    this.lastSavePromise = savePromise;
+
+    return savePromise;
+  }
+
+  /**
+   * Writes pending changes to file system synchronously. This method
+   * is meant to be called while the process is exiting.
+   * @returns {Boolean} 
+   */
+  flush() {
+    if (this.savedChangeCount === this.changeCount) { return true; }
+
+    const changeCount = this.changeCount;
+
+    this.clearPendingChanges();
+
     try {
-      await FileUtilities.writeFileAsync(this.dataFilePath, this.data);
+      FileUtilities.writeFileAtomically(this.dataFilePath, this.data);
+
+      this.savedChangeCount = changeCount;
+    } catch (error) {
+      this.logger.error('An error occurred while flushing application state to file system.', error);
+
+      return false;
+    }
+
+    return true;
+  }
+
+  /**
+   * @returns {Promise<Boolean>} 
+   */
+  async writeAsync() {
+    // changes made after this point shall be written by a subsequent save...
+    const changeCount = this.changeCount;
+
+    this.clearPendingChanges();
+
+    try {
+      await FileUtilities.writeFileAtomicallyAsync(this.dataFilePath, this.data);
+
+      this.savedChangeCount = Math.max(this.savedChangeCount, changeCount);
     } catch (error) {
       this.logger.error('An error occurred while saving application state to file system.', error);
 
@@ -40,6 +104,34 @@ module.exports.ApplicationStateService = class ApplicationStateService {
     return true;
   }
 
+  clearPendingChanges() {
+    this.pendingChangeCount = 0;
+
+    clearTimeout(this.flushTimeout);
+
+    this.flushTimeout = undefined;
+  }
+
+  /**
+   * Schedules a save so that changes made within the flush interval
+   * are written together.
+   */
+  scheduleSave() {
+    this.pendingChangeCount++;
+
+    if (this.pendingChangeCount >= applicationState.maxPendingChanges) {
+      this.saveAsync();
+
+      return;
+    }
+
+    if (this.flushTimeout) { return; }
+
+    this.flushTimeout = setTimeout(() => this.saveAsync(), applicationState.flushInterval);
+    // pending save shall not keep the process alive...
+    this.flushTimeout.unref();
+  }
+
   /**
    * @param {String} key 
    * @returns {Promise<any>} 
@@ -50,11 +142,13 @@ module.exports.ApplicationStateService = class ApplicationStateService {
 
   /**
    * @param {Object} data 
-   * @param {Boolean} flush 
+   * @param {Boolean} flush If true, changes are written immediately.
+   * Otherwise, changes are coalesced and written later.
+   * @returns {Promise<Boolean>} Returns false if immediate write fails.
    */
   async setAsync(data, flush = true) {
     // data must be an object and cannot be an array...
-    if (typeof data !== 'object' || Array.isArray(data)) { return; }
+    if (typeof data !== 'object' || Array.isArray(data)) { return false; }
 
     const entries = Object.entries(data);
 
@@ -62,7 +156,13 @@ module.exports.ApplicationStateService = class ApplicationStateService {
       this.data[key] = value;
     }
 
-    flush && await this.saveAsync();
+    this.changeCount++;
+
+    if (flush) { return await this.saveAsync(); }
+
+    this.scheduleSave();
+
+    return true;
   }
 
   static instance = new ApplicationStateService();
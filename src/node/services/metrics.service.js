@@ -0,0 +1,157 @@
+// upper bounds (in seconds) of latency histogram buckets...
+const LATENCY_BUCKETS_IN_SECONDS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30];
+
+module.exports.MetricsService = class MetricsService {
+
+  constructor() {
+    // holds metric families by name...
+    this.families = new Map();
+  }
+
+  /**
+   * Registers a metric family. Registering an existing family has no effect.
+   * @param {String} name Metric name.
+   * @param {'counter'|'gauge'|'histogram'} type Metric type.
+   * @param {String} help Description of the metric.
+   * @returns {this} Returns the metrics service itself.
+   */
+  register(name, type, help) {
+    if (this.families.has(name)) { return this; }
+
+    this.families.set(name, { name: name, type: type, help: help, samples: new Map(), });
+
+    return this;
+  }
+
+  /**
+   * Increments a counter.
+   * @param {String} name Metric name.
+   * @param {Object} labels Labels of the sample.
+   * @param {Number} value Value to be added.
+   */
+  increment(name, labels = {}, value = 1) {
+    const sample = this.getSample(name, labels, () => ({ labels: labels, value: 0, }));
+    sample.value += value;
+  }
+
+  /**
+   * Sets the value of a gauge.
+   * @param {String} name Metric name.
+   * @param {Object} labels Labels of the sample.
+   * @param {Number} value Value of the gauge.
+   */
+  set(name, labels = {}, value = 0) {
+    const sample = this.getSample(name, labels, () => ({ labels: labels, value: 0, }));
+    sample.value = value;
+  }
+
+  /**
+   * Removes all the samples of a metric.
+   * @param {String} name Metric name.
+   */
+  reset(name) {
+    this.families.get(name)?.samples.clear();
+  }
+
+  /**
+   * Records an observation to a histogram.
+   * @param {String} name Metric name.
+   * @param {Object} labels Labels of the sample.
+   * @param {Number} value Observed value.
+   */
+  observe(name, labels = {}, value = 0) {
+    const sample = this.getSample(name, labels, () => ({
+      labels: labels,
+      buckets: LATENCY_BUCKETS_IN_SECONDS.map(() => 0),
+      sum: 0,
+      count: 0,
+    }));
+
+    for (let i = 0; i < LATENCY_BUCKETS_IN_SECONDS.length; i++) {
+      if (value <= LATENCY_BUCKETS_IN_SECONDS[i]) {
+        sample.buckets[i]++;
+      }
+    }
+
+    sample.sum += value;
+    sample.count++;
+  }
+
+  /**
+   * Serializes all the metrics in Prometheus text exposition format.
+   * @returns {String} Returns the serialized metrics.
+   */
+  toPrometheusText() {
+    const lines = [];
+
+    for (const family of this.families.values()) {
+      lines.push(`# HELP ${family.name} ${family.help}`);
+      lines.push(`# TYPE ${family.name} ${family.type}`);
+
+      for (const sample of family.samples.values()) {
+        if (family.type !== 'histogram') {
+          lines.push(`${family.name}${MetricsService.formatLabels(sample.labels)} ${sample.value}`);
+
+          continue;
+        }
+
+        for (let i = 0; i < LATENCY_BUCKETS_IN_SECONDS.length; i++) {
+          const labels = { ...sample.labels, le: LATENCY_BUCKETS_IN_SECONDS[i], };
+
+          lines.push(`${family.name}_bucket${MetricsService.formatLabels(labels)} ${sample.buckets[i]}`);
+        }
+
+        lines.push(`${family.name}_bucket${MetricsService.formatLabels({ ...sample.labels, le: '+Inf', })} ${sample.count}`);
+        lines.push(`${family.name}_sum${MetricsService.formatLabels(sample.labels)} ${sample.sum}`);
+        lines.push(`${family.name}_count${MetricsService.formatLabels(sample.labels)} ${sample.count}`);
+      }
+    }
+
+    return `${lines.join('\n')}\n`;
+  }
+
+  /**
+   * @param {String} name
+   * @param {Object} labels
+   * @param {Function} createSample
+   * @returns {any}
+   */
+  getSample(name, labels, createSample) {
+    const family = this.families.get(name);
+
+    if (!family) { throw new Error(`Metric '${name}' is not registered.`); }
+
+    const key = MetricsService.formatLabels(labels);
+    let sample = family.samples.get(key);
+
+    if (!sample) {
+      sample = createSample();
+      family.samples.set(key, sample);
+    }
+
+    return sample;
+  }
+
+  /**
+   * @param {Object} labels
+   * @returns {String}
+   */
+  static formatLabels(labels) {
+    const entries = Object.entries(labels);
+
+    if (!entries.length) { return ''; }
+
+    const formattedLabels = entries.map(([name, value]) => {
+      // escapes backslashes, double quotes and new lines as required by the exposition format...
+      const escapedValue = `${value}`.replace(/\\/g, '\\\\').replace(/"/g, '\\"').replace(/\n/g, '\\n');
+
+      return `${name}="${escapedValue}"`;
+    });
+
+    return `{${formattedLabels.join(',')}}`;
+  }
+
+  static instance = new MetricsService();
+
+  static getInstance() { return this.instance; }
+}
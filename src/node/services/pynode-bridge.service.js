@@ -3,11 +3,19 @@ const fileSystem = require('fs');
 const childProcess = require('child_process');
 const { EventManager } = require('@shahadul-17/event-manager');
 const { UIDGenerator } = require('@shahadul-17/uid-generator');
+const { MetricsService } = require('./metrics.service');
+const { pythonLoader, } = require('../configuration');
 
 const PYTHON_LOADER_FILE_NAME = 'Loader.py';
 const PYTHON_DEFAULT_WINDOWS_PATH = 'C:\\Program Files\\Python310';
 const RESPONSE_START_FLAG = '<------------------- START ------------------->';
 const RESPONSE_END_FLAG = '<------------------- END ------------------->';
+const LOADER_READY_TIMEOUT = 30000;       // replacement loader must become ready within 30 seconds...
+const LOADER_DRAIN_TIMEOUT = 60000;       // replaced loader must process its requests within 60 seconds...
+const LOADER_EXIT_TIMEOUT = 10000;        // replaced loader is killed if it does not exit within 10 seconds after being asked to...
+const METRICS_REQUEST_TIMEOUT = 2000;     // python loader must send its metrics within 2 seconds...
+const PYTHON_SCRIPTS_DIRECTORY_PATH = path.resolve(__dirname, '..', '..', 'python', 'scripts');
+const UNKNOWN_METRIC_LABEL = 'unknown';
 
 module.exports.PyNodeBridgeService = class PyNodeBridgeService extends EventManager {
 
@@ -16,28 +24,60 @@ module.exports.PyNodeBridgeService = class PyNodeBridgeService extends EventMana
   constructor() {
     super();
 
-    this.response = '';
     this.isDestroyed = false;
     this.uidGenerator = UIDGenerator.create();
-    this.pythonProcess = undefined;
+    // options that are used to spawn python loaders...
+    this.options = undefined;
+    // python loader that receives new requests...
+    this.loader = undefined;
+    // python loaders that are being replaced and shall exit once their requests are processed...
+    this.drainingLoaders = new Set();
+    // requests waiting for responses from python loaders by request ID...
+    this.pendingRequests = new Map();
+    this.restartPromise = undefined;
+    // names of the functions defined by python scripts (along with modification time) by module path...
+    this.scriptFunctionNames = new Map();
+    this.metricsService = MetricsService.getInstance()
+      .register('pynode_bridge_requests_total', 'counter', 'Number of requests processed by python scripts.')
+      .register('pynode_bridge_request_duration_seconds', 'histogram', 'Time taken to receive responses from python scripts.')
+      .register('pynode_bridge_pending_requests', 'gauge', 'Number of requests waiting for responses from python loader.')
+      .register('pynode_bridge_loader_spawns_total', 'counter', 'Number of times python loader process has been spawned.')
+      .register('pynode_bridge_loader_restarts_total', 'counter', 'Number of rolling restarts of python loader.')
+      .register('pynode_bridge_pipe_bytes_total', 'counter', 'Number of bytes transferred through python loader standard input/output.')
+      .register('pynode_loader_requests_total', 'counter', 'Number of requests received by python loader.')
+      .register('pynode_loader_up', 'gauge', 'Whether python loader has sent its metrics during the last collection.')
+      .register('pynode_loader_queue_depth', 'gauge', 'Number of requests received by python loader that have not been answered yet.')
+      .register('pynode_loader_workers', 'gauge', 'Number of python loader workers by state.')
+      .register('pynode_loader_running_processes', 'gauge', 'Number of child processes executing script functions.')
+      .register('pynode_loader_worker_recycles_total', 'counter', 'Number of python loader workers recycled by reason.')
+      .register('pynode_loader_worker_crashes_total', 'counter', 'Number of python loader workers that have stopped unexpectedly.')
+      .register('pynode_loader_interrupted_tasks_total', 'counter', 'Number of tasks failed because the worker executing them has stopped.')
+      .register('pynode_loader_process_spawns_total', 'counter', 'Number of child processes spawned by python loader.')
+      .register('pynode_loader_cache_hits_total', 'counter', 'Number of cache hits by cache namespace.')
+      .register('pynode_loader_cache_misses_total', 'counter', 'Number of cache misses by cache namespace.')
+      .register('pynode_loader_cache_evictions_total', 'counter', 'Number of cache entries evicted by cache namespace.')
+      .register('pynode_loader_cache_entries', 'gauge', 'Number of cache entries by cache namespace.')
+      .register('pynode_loader_resident_memory_bytes', 'gauge', 'Resident set size of python loader process.');
   }
 
   getProcessId() {
-    return this.pythonProcess?.pid ?? -1;
+    return this.loader?.process.pid ?? -1;
   }
 
   /**
    * Sends data to python process.
    * @param {any} data Request data to be sent.
+   * @param {any} loader Python loader to which the data shall be sent.
    */
-  send(data) {
+  send(data, loader = this.loader) {
     if (!data || typeof data !== 'object') { return false; }
 
     // parsing data as JSON...
     const dataAsJson = JSON.stringify(data);
 
     // writing to python process...
-    this.pythonProcess.stdin.write(`${dataAsJson}\n`);
+    loader.process.stdin.write(`${dataAsJson}\n`);
+    this.metricsService.increment('pynode_bridge_pipe_bytes_total', { direction: 'out', }, Buffer.byteLength(dataAsJson) + 1);
 
     return true;
   }
@@ -50,30 +90,34 @@ module.exports.PyNodeBridgeService = class PyNodeBridgeService extends EventMana
   destroy() {
     this.isDestroyed = true;
 
-    if (!this.pythonProcess) { return false; }
+    if (!this.loader) { return false; }
 
-    this.send({ exit: true });
-    this.pythonProcess.stdin.destroy();
-    this.pythonProcess.kill();
+    for (const loader of [this.loader, ...this.drainingLoaders]) {
+      this.send({ exit: true }, loader);
+      loader.process.stdin.destroy();
+      loader.process.kill();
+    }
+
+    this.drainingLoaders.clear();
 
     return true;
   }
 
-  parseResponse() {
-    const indexOfResponseStartFlag = this.response.indexOf(RESPONSE_START_FLAG);
-    const indexOfResponseEndFlag = this.response.indexOf(RESPONSE_END_FLAG);
+  parseResponse(loader) {
+    const indexOfResponseStartFlag = loader.response.indexOf(RESPONSE_START_FLAG);
+    const indexOfResponseEndFlag = loader.response.indexOf(RESPONSE_END_FLAG);
 
     if (indexOfResponseStartFlag === -1 || indexOfResponseEndFlag === -1) { return undefined; }
 
     // creating a copying of response...
-    let response = this.response;
+    let response = loader.response;
     // stripping end flag from response...
     response = response.substring(0, indexOfResponseEndFlag);
     // stripping start flag from response...
     response = response.substring(indexOfResponseStartFlag + RESPONSE_START_FLAG.length);
 
-    // removing previously received/processed response from the global response...
-    this.response = this.response.substring(indexOfResponseEndFlag + RESPONSE_END_FLAG.length);
+    // removing previously received/processed response from the loader's response...
+    loader.response = loader.response.substring(indexOfResponseEndFlag + RESPONSE_END_FLAG.length);
 
     // if response is JSON...
     if (PyNodeBridgeService.isJson(response)) {
@@ -88,6 +132,180 @@ module.exports.PyNodeBridgeService = class PyNodeBridgeService extends EventMana
     return response;
   }
 
+  /**
+   * Handles every complete response that has been received from a python loader.
+   * @param {any} loader Python loader that sent the responses.
+   */
+  handleResponses(loader) {
+    let response;
+
+    // a single chunk may contain more than one response...
+    while ((response = this.parseResponse(loader)) !== undefined) {
+      // python loader lets us know when it is ready to process requests...
+      if (response.ready === true) {
+        loader.isReady = true;
+        loader.onReady();
+
+        continue;
+      }
+
+      const pendingRequest = this.pendingRequests.get(response.request_id);
+
+      if (pendingRequest) {
+        this.completeRequest(response.request_id);
+
+        // removing the request data from the response object...
+        delete response.request_id;
+
+        pendingRequest.resolve(response);
+      }
+
+      // fires response event listener...
+      this.fireEventListeners({ type: 'RESPONSE', response: response, });
+    }
+  }
+
+  /**
+   * Removes a pending request and lets a draining loader exit once
+   * all of its requests have been processed.
+   * @param {String} requestId
+   */
+  completeRequest(requestId) {
+    const { loader, timeout, } = this.pendingRequests.get(requestId);
+
+    clearTimeout(timeout);
+    this.pendingRequests.delete(requestId);
+    loader.pendingRequestCount--;
+
+    if (this.drainingLoaders.has(loader) && loader.pendingRequestCount === 0) {
+      this.exitLoader(loader);
+    }
+  }
+
+  /**
+   * Rejects all the requests that are waiting for responses from a loader.
+   * @param {any} loader
+   * @param {Error} error
+   */
+  rejectRequests(loader, error) {
+    for (const [requestId, pendingRequest] of this.pendingRequests) {
+      if (pendingRequest.loader !== loader) { continue; }
+
+      this.completeRequest(requestId);
+
+      pendingRequest.reject(error);
+    }
+  }
+
+  /**
+   * Asks a python loader to exit.
+   * @param {any} loader
+   */
+  exitLoader(loader) {
+    clearTimeout(loader.drainTimeout);
+    this.drainingLoaders.delete(loader);
+    this.send({ exit: true }, loader);
+    loader.process.stdin.end();
+    // loader is killed if it does not exit in time (e.g. while waiting for child processes)...
+    loader.exitTimeout = setTimeout(() => loader.process.kill(), LOADER_EXIT_TIMEOUT);
+  }
+
+  /**
+   * Rejects the requests of a draining loader that has not processed them
+   * in time so that the loader is asked to exit.
+   * @param {any} loader
+   */
+  abandonLoader(loader) {
+    if (!this.drainingLoaders.has(loader)) { return; }
+
+    // rejecting the last request asks the loader to exit...
+    this.rejectRequests(loader, new Error('Python loader did not send the response before being replaced.'));
+  }
+
+  /**
+   * Spawns a new python loader.
+   * @returns {any} Returns the spawned python loader.
+   */
+  spawnLoader() {
+    const options = this.options;
+    const loader = {
+      process: undefined,
+      // holds data received from python loader until complete responses are parsed...
+      response: '',
+      isReady: false,
+      pendingRequestCount: 0,
+      onReady: () => {},
+      readyPromise: undefined,
+      drainTimeout: undefined,
+      exitTimeout: undefined,
+    };
+
+    loader.readyPromise = new Promise(resolve => loader.onReady = resolve);
+    // spawns python application as child process...
+    loader.process = childProcess.spawn(
+      options.pythonInterpreterFileName ?? PyNodeBridgeService.getPythonInterpreterFileName(),
+      [`src/python/services/${PYTHON_LOADER_FILE_NAME}`], options.spawnOptions);
+
+    this.metricsService.increment('pynode_bridge_loader_spawns_total');
+
+    // adding listener to know if python process has exited...
+    loader.process.on('close', () => {
+      clearTimeout(loader.drainTimeout);
+      clearTimeout(loader.exitTimeout);
+      this.drainingLoaders.delete(loader);
+      // requests that have not been processed by this loader are lost...
+      this.rejectRequests(loader, new Error('Python loader exited before sending the response.'));
+
+      // only the loader that receives new requests is respawned...
+      if (this.isDestroyed || loader !== this.loader) { return; }
+
+      // respawns python process if closes...
+      this.loader = this.spawnLoader();
+    });
+
+    // adding listener to catch exception from python process...
+    loader.process.on('error', error => {
+      this.rejectRequests(loader, error);
+      this.fireEventListeners({ type: 'ERROR', error: error, });
+    });
+
+    // adding listener to catch error while writing to python process (e.g. if it has exited)...
+    loader.process.stdin.on('error', error => {
+      this.rejectRequests(loader, error);
+      this.fireEventListeners({ type: 'ERROR', error: error, });
+    });
+
+    // adding listener to catch error while reading from python process...
+    loader.process.stdout.on('error', error => {
+      this.rejectRequests(loader, error);
+      this.fireEventListeners({ type: 'ERROR', error: error, });
+    });
+
+    // adding listener to read data from python process...
+    loader.process.stdout.on('data', chunk => {
+      // fires data event listener...
+      this.fireEventListeners({ type: 'DATA', chunk: chunk, });
+      this.metricsService.increment('pynode_bridge_pipe_bytes_total', { direction: 'in', }, chunk.length);
+
+      // concatenating chunk to response...
+      loader.response += chunk.toString();
+
+      // parses and handles complete responses (if any)...
+      this.handleResponses(loader);
+    });
+
+    // adding listener to know when all the data has successfully been read from the python process...
+    loader.process.stdout.on('end', () => {
+      // parses and handles complete responses (if any)...
+      this.handleResponses(loader);
+
+      // fires end event listener...
+      this.fireEventListeners({ type: 'END', });
+    });
+
+    return loader;
+  }
+
   /**
    * Initializes PyNode Bridge service.
    * @param {{
@@ -103,7 +321,13 @@ module.exports.PyNodeBridgeService = class PyNodeBridgeService extends EventMana
 
       const spawnOptions = {
         shell: true,
-        env: { ...process.env, },
+        env: {
+          ...process.env,
+          // limits at which python loader recycles its workers...
+          PYNODE_WORKER_MAXIMUM_TASK_COUNT: `${pythonLoader.workers.maxTaskCount}`,
+          PYNODE_WORKER_MAXIMUM_TASK_COUNT_JITTER: `${pythonLoader.workers.maxTaskCountJitter}`,
+          PYNODE_WORKER_MAXIMUM_RESIDENT_SET_SIZE: `${pythonLoader.workers.maxResidentSetSize}`,
+        },
       };
 
       options.pathEnvironmentVariable = Array.isArray(options.pathEnvironmentVariable) ? options.pathEnvironmentVariable : [];
@@ -130,67 +354,10 @@ module.exports.PyNodeBridgeService = class PyNodeBridgeService extends EventMana
         spawnOptions.env.PATH += `${path.delimiter}${variable}`;
       }
 
+      this.options = { ...options, spawnOptions: spawnOptions, };
+
       try {
-        // spawns python application as child process...
-        this.pythonProcess = childProcess.spawn(
-          options.pythonInterpreterFileName ?? PyNodeBridgeService.getPythonInterpreterFileName(),
-          [`src/python/services/${PYTHON_LOADER_FILE_NAME}`], spawnOptions);
-
-        // adding listener to know if python process has exited...
-        this.pythonProcess.on('close', async () => {
-          if (this.isDestroyed) { return; }
-
-          // respawns python process if closes...
-          await this.initializeAsync(options);
-        });
-
-        // adding listener to catch exception from python process...
-        this.pythonProcess.on('error', error => this.fireEventListeners({
-          type: 'ERROR',
-          error: error,
-        }));
-
-        // adding listener to catch error while reading from python process...
-        this.pythonProcess.stdout.on('error', error => this.fireEventListeners({
-          type: 'ERROR',
-          error: error,
-        }));
-
-        // adding listener to read data from python process...
-        this.pythonProcess.stdout.on('data', chunk => {
-          // fires data event listener...
-          this.fireEventListeners({ type: 'DATA', chunk: chunk, });
-
-          // concatenating chunk to response...
-          this.response += chunk.toString();
-
-          // if complete response has been received, response will be parsed.
-          // otherwise, this method will return undefined...
-          const parsedResponse = this.parseResponse();
-
-          // fires response event listener if response is parsed successfully...
-          parsedResponse && this.fireEventListeners({ type: 'RESPONSE', response: parsedResponse, });
-        });
-
-        // adding listener to know when all the data has successfully been read from the python process...
-        this.pythonProcess.stdout.on('end', () => {
-          // if complete response has been received, response will be parsed.
-          // otherwise, this method will return undefined...
-          const parsedResponse = this.parseResponse();
-
-          // fires response event listener if response is parsed successfully...
-          parsedResponse && this.fireEventListeners({ type: 'RESPONSE', response: parsedResponse, });
-
-          // fires end event listener...
-          this.fireEventListeners({ type: 'END', });
-        });
-
-        // adding listener to read error data from python process...
-        // this.pythonProcess.stderr.on('data', chunk => { errorResponse += chunk.toString(); });
-        // adding listener to know if there occurs an error while reading error from python process...
-        // this.pythonProcess.stderr.on('error', error => reject(error));
-        // adding listener to know when all the error data has successfully been read from the python process...
-        // this.pythonProcess.stderr.on('end', () => reject(errorResponse));
+        this.loader = this.spawnLoader();
       } catch (error) {
         reject(error);
       }
@@ -199,6 +366,98 @@ module.exports.PyNodeBridgeService = class PyNodeBridgeService extends EventMana
     });
   }
 
+  /**
+   * Replaces the python loader without dropping requests. A new loader
+   * is spawned and receives new requests as soon as it is ready. The
+   * previous loader exits after processing the requests it has received.
+   * @returns {Promise<void>} Returns a promise.
+   */
+  restartAsync() {
+    // concurrent restart requests share the restart that is in progress...
+    this.restartPromise ??= this.replaceLoaderAsync()
+      .finally(() => this.restartPromise = undefined);
+
+    return this.restartPromise;
+  }
+
+  async replaceLoaderAsync() {
+    if (this.isDestroyed || !this.loader) { throw new Error('PyNode Bridge service is not initialized.'); }
+
+    const loader = this.spawnLoader();
+    let readyTimeout;
+
+    try {
+      await Promise.race([
+        loader.readyPromise,
+        new Promise((_, reject) => {
+          readyTimeout = setTimeout(() => reject(new Error('Python loader did not become ready in time.')), LOADER_READY_TIMEOUT);
+          loader.process.on('close', () => reject(new Error('Python loader exited before becoming ready.')));
+        }),
+      ]);
+    } catch (error) {
+      // previous loader keeps receiving requests...
+      loader.process.kill();
+
+      throw error;
+    } finally {
+      clearTimeout(readyTimeout);
+    }
+
+    const previousLoader = this.loader;
+
+    // new requests are routed to the new loader from now on...
+    this.loader = loader;
+    this.drainingLoaders.add(previousLoader);
+    this.metricsService.increment('pynode_bridge_loader_restarts_total');
+
+    // previous loader exits right away if it has nothing to process...
+    if (previousLoader.pendingRequestCount === 0) {
+      this.exitLoader(previousLoader);
+
+      return;
+    }
+
+    // requests that the previous loader does not process in time are rejected...
+    previousLoader.drainTimeout = setTimeout(() => this.abandonLoader(previousLoader), LOADER_DRAIN_TIMEOUT);
+  }
+
+  /**
+   * Sends a request to python loader and waits for the response
+   * that carries the same request ID.
+   * @param {any} data Request data to be sent.
+   * @param {Number} timeout (Optional) Milliseconds to wait for the response.
+   * @returns {Promise<any>} Returns a promise that resolves to python response.
+   */
+  sendRequestAsync(data, timeout = undefined) {
+    return new Promise((resolve, reject) => {
+      // generating a unique request ID...
+      const requestId = this.uidGenerator.generate();
+      const loader = this.loader;
+
+      if (!loader) { return reject(new Error('PyNode Bridge service is not initialized.')); }
+
+      try {
+        const pendingRequest = { loader: loader, resolve: resolve, reject: reject, timeout: undefined, };
+
+        if (typeof timeout === 'number') {
+          pendingRequest.timeout = setTimeout(() => {
+            // response that arrives afterwards is ignored...
+            this.completeRequest(requestId);
+            reject(new Error('Python loader did not send the response in time.'));
+          }, timeout);
+        }
+
+        this.pendingRequests.set(requestId, pendingRequest);
+        loader.pendingRequestCount++;
+        // writing data to python process...
+        this.send({ ...data, requestId: requestId, }, loader);
+      } catch (error) {
+        this.completeRequest(requestId);
+        reject(error);
+      }
+    });
+  }
+
   /**
    * Retrieves response from python application.
    * @param {{
@@ -208,53 +467,147 @@ module.exports.PyNodeBridgeService = class PyNodeBridgeService extends EventMana
    * }} options Request options that are required to get response.
    * @returns {Promise<any>} Returns a promise that resolves to python response.
    */
-  getResponseFromPythonAsync(options) {
-    const context = this;
+  async getResponseFromPythonAsync(options) {
+    // resolves module path...
+    const modulePath = path.resolve(PYTHON_SCRIPTS_DIRECTORY_PATH, options.moduleName);
+    const labels = this.getRequestMetricLabels(modulePath, options.moduleName, options.functionName);
+    const startTime = process.hrtime.bigint();
+    let hasSucceeded = false;
+
+    try {
+      const response = await this.sendRequestAsync({
+        moduleName: options.moduleName,
+        modulePath: modulePath,
+        functionName: options.functionName,
+        functionArguments: options.functionArguments,
+      });
+
+      hasSucceeded = response.hasSucceeded === true;
+
+      return response;
+    } finally {
+      const durationInSeconds = Number(process.hrtime.bigint() - startTime) / 1e9;
+
+      this.metricsService.increment('pynode_bridge_requests_total', { ...labels, status: hasSucceeded ? 'succeeded' : 'failed', });
+      this.metricsService.observe('pynode_bridge_request_duration_seconds', labels, durationInSeconds);
+    }
+  }
 
-    return new Promise((resolve, reject) => {
-      // generating a unique request ID...
-      const requestId = this.uidGenerator.generate();
+  /**
+   * Returns metric labels of a request. Names that are not defined by any
+   * python script are replaced so that clients cannot create new series.
+   * @param {String} modulePath Resolved path of the module.
+   * @param {String} moduleName Name of the module requested by client.
+   * @param {String} functionName Name of the function requested by client.
+   * @returns {any} Returns the labels.
+   */
+  getRequestMetricLabels(modulePath, moduleName, functionName) {
+    const functionNames = this.getScriptFunctionNames(modulePath);
 
-      function onErrorOccurred(eventArguments) {
-        context.removeEventListener(onErrorOccurred);
+    if (!functionNames) {
+      return { module: UNKNOWN_METRIC_LABEL, function: UNKNOWN_METRIC_LABEL, };
+    }
 
-        reject(eventArguments.error);
-      }
+    return {
+      module: moduleName,
+      function: functionNames.has(functionName) ? functionName : UNKNOWN_METRIC_LABEL,
+    };
+  }
+
+  /**
+   * Returns names of the module level functions of a python script.
+   * @param {String} modulePath Resolved path of the module.
+   * @returns {Set<String>} Returns the function names or undefined if
+   * the path does not refer to a python script.
+   */
+  getScriptFunctionNames(modulePath) {
+    // modules outside of the scripts directory are never labeled...
+    if (path.dirname(modulePath) !== PYTHON_SCRIPTS_DIRECTORY_PATH) { return undefined; }
 
-      function onResponseReceived(eventArguments) {
-        context.removeEventListener(onResponseReceived);
+    let modificationTime;
 
-        const response = eventArguments.response;
+    try {
+      modificationTime = fileSystem.statSync(modulePath).mtimeMs;
+    } catch (error) {
+      this.scriptFunctionNames.delete(modulePath);
 
-        // if request ID that we received from the response
-        // is not equal to the generated request ID, we shall not proceed...
-        if (response.request_id !== requestId) { return; }
+      return undefined;
+    }
 
-        // removing the request data from the response object...
-        delete response.request_id;
+    let scriptFunctionNames = this.scriptFunctionNames.get(modulePath);
 
-        // but if the request ID is equal to our generated one,
-        // we shall resolve the response...
-        resolve(response);
-      }
+    // scripts may be modified while the application is running...
+    if (!scriptFunctionNames || scriptFunctionNames.modificationTime !== modificationTime) {
+      const content = fileSystem.readFileSync(modulePath, 'utf-8');
 
-      try {
-        // adding listener to catch exception from python process...
-        this.addEventListener('ERROR', onErrorOccurred);
-        this.addEventListener('RESPONSE', onResponseReceived);
-        // writing data to python process...
-        this.send({
-          requestId: requestId,
-          moduleName: options.moduleName,
-          // resolves module path...
-          modulePath: path.resolve(__dirname, '..', '..', 'python', 'scripts', options.moduleName),
-          functionName: options.functionName,
-          functionArguments: options.functionArguments,
-        });
-      } catch (error) {
-        reject(error);
-      }
-    });
+      scriptFunctionNames = {
+        modificationTime: modificationTime,
+        functionNames: new Set(Array.from(content.matchAll(/^def\s+(\w+)\s*\(/gm), match => match[1])),
+      };
+      this.scriptFunctionNames.set(modulePath, scriptFunctionNames);
+    }
+
+    return scriptFunctionNames.functionNames;
+  }
+
+  /**
+   * Retrieves runtime counters from python loader and updates
+   * the metrics accordingly. Counters of python loader are left
+   * unchanged if python loader does not answer in time.
+   * @returns {Promise<void>} Returns a promise.
+   */
+  async collectMetricsAsync() {
+    const metricsService = this.metricsService;
+
+    metricsService.set('pynode_bridge_pending_requests', {}, this.pendingRequests.size);
+
+    let response;
+
+    try {
+      response = await this.sendRequestAsync({ metrics: true, }, METRICS_REQUEST_TIMEOUT);
+    } catch (error) {
+      // metrics collected by node are exported even if python loader does not answer...
+      metricsService.set('pynode_loader_up', {}, 0);
+      console.error('An error occurred while collecting metrics from python loader.', error);
+
+      return;
+    }
+
+    const metrics = response.metrics ?? {};
+
+    metricsService.set('pynode_loader_up', {}, 1);
+
+    metricsService.set('pynode_loader_requests_total', {}, metrics.requests ?? 0);
+    metricsService.set('pynode_loader_queue_depth', {}, metrics.queueDepth ?? 0);
+    metricsService.set('pynode_loader_workers', { state: 'busy', }, metrics.busyWorkers ?? 0);
+    metricsService.set('pynode_loader_workers', { state: 'idle', }, metrics.idleWorkers ?? 0);
+    metricsService.set('pynode_loader_running_processes', {}, metrics.runningProcesses ?? 0);
+    metricsService.set('pynode_loader_process_spawns_total', {}, metrics.processSpawns ?? 0);
+    metricsService.set('pynode_loader_interrupted_tasks_total', {}, metrics.interruptedTasks ?? 0);
+    metricsService.set('pynode_loader_worker_crashes_total', {}, metrics.workerCrashes ?? 0);
+    metricsService.set('pynode_loader_resident_memory_bytes', {}, metrics.residentSetSizeInBytes ?? 0);
+
+    // reasons that have not been reported by the current python loader are forgotten...
+    metricsService.reset('pynode_loader_worker_recycles_total');
+
+    for (const [reason, count] of Object.entries(metrics.workerRecycles ?? {})) {
+      metricsService.set('pynode_loader_worker_recycles_total', { reason: reason, }, count);
+    }
+
+    // cache namespaces are forgotten whenever python loader is respawned...
+    metricsService.reset('pynode_loader_cache_hits_total');
+    metricsService.reset('pynode_loader_cache_misses_total');
+    metricsService.reset('pynode_loader_cache_evictions_total');
+    metricsService.reset('pynode_loader_cache_entries');
+
+    for (const [namespace, statistics] of Object.entries(metrics.cache ?? {})) {
+      const labels = { namespace: namespace, };
+
+      metricsService.set('pynode_loader_cache_hits_total', labels, statistics.hits);
+      metricsService.set('pynode_loader_cache_misses_total', labels, statistics.misses);
+      metricsService.set('pynode_loader_cache_evictions_total', labels, statistics.evictions);
+      metricsService.set('pynode_loader_cache_entries', labels, statistics.size);
+    }
   }
 
   static isJson(text) {
@@ -1,4 +1,4 @@
-const { instanceId, } = require('../configuration');
+const { instanceId, uids, } = require('../configuration');
 const { UIDGenerator } = require('@shahadul-17/uid-generator');
 const { ApplicationStateService } = require('./application-state.service');
 
@@ -7,21 +7,63 @@ module.exports.UIDService = class UIDService {
   constructor() {
     this.uidGenerator = UIDGenerator.create();
     this.applicationStateService = ApplicationStateService.getInstance();
+    // last UID of the most recently reserved range...
+    this.lastReservedUid = undefined;
+    // number of UIDs that can be generated before another range must be reserved...
+    this.remainingReservedUidCount = 0;
+    this.reservationPromise = undefined;
   }
 
   async loadLastGeneratedUIDAsync() {
-    const lastGeneratedUid = await this.applicationStateService.getAsync('lastGeneratedUid');
+    // application states saved before ranges were reserved only contain the last generated UID...
+    const lastReservedUid = await this.applicationStateService.getAsync('lastReservedUid')
+      ?? await this.applicationStateService.getAsync('lastGeneratedUid');
 
-    if (typeof lastGeneratedUid !== 'string') { return; }
+    if (typeof lastReservedUid !== 'string') { return; }
 
-    this.uidGenerator.setLast(lastGeneratedUid);
+    // UIDs that were reserved but not generated before restart are skipped...
+    this.uidGenerator.setLast(lastReservedUid);
+    this.lastReservedUid = lastReservedUid;
+    this.remainingReservedUidCount = 0;
+  }
+
+  /**
+   * Reserves the next range of UIDs by saving only the last UID of the range.
+   */
+  async reserveUIDRangeAsync() {
+    // a separate generator walks to the end of the range...
+    const reservationGenerator = UIDGenerator.create();
+    let lastReservedUid = this.lastReservedUid;
+
+    if (typeof lastReservedUid === 'string') {
+      reservationGenerator.setLast(lastReservedUid);
+    }
+
+    for (let i = 0; i < uids.reservationSize; i++) {
+      lastReservedUid = reservationGenerator.generate();
+    }
+
+    // range must be saved before any UID from the range is handed out...
+    const hasSaved = await this.applicationStateService.setAsync({ lastReservedUid: lastReservedUid, });
+
+    if (!hasSaved) { throw new Error('An error occurred while reserving UID range.'); }
+
+    this.lastReservedUid = lastReservedUid;
+    this.remainingReservedUidCount = uids.reservationSize;
   }
 
   async generateUIDAsync() {
-    const uid = this.uidGenerator.generate();
+    while (this.remainingReservedUidCount === 0) {
+      // concurrent callers wait for the same reservation...
+      this.reservationPromise ??= this.reserveUIDRangeAsync()
+        .finally(() => this.reservationPromise = undefined);
+
+      await this.reservationPromise;
+    }
 
-    // saves the newly generated UID as last generated UID to application state...
-    await this.applicationStateService.setAsync({ lastGeneratedUid: uid, });
+    this.remainingReservedUidCount--;
+
+    const uid = this.uidGenerator.generate();
 
     return `${instanceId}-${uid}`;
   }
@@ -0,0 +1,39 @@
+# dictionary that is handed to the script functions as cache. it counts
+# the lookups (via get() or []) that have found or missed their keys...
+class CacheDictionary(dict):
+
+  def __init__(self, *arguments, **keyword_arguments):
+    super().__init__(*arguments, **keyword_arguments)
+
+    self.__hit_count = 0
+    self.__miss_count = 0
+
+  def get(self, key, default = None):
+    is_hit = key in self
+    self.__record_lookup(is_hit)
+
+    return super().get(key, default)
+
+  def __getitem__(self, key):
+    is_hit = key in self
+    self.__record_lookup(is_hit)
+
+    return super().__getitem__(key)
+
+  # records a lookup...
+  def __record_lookup(self, is_hit: bool):
+    if is_hit:
+      self.__hit_count += 1
+    else:
+      self.__miss_count += 1
+
+  # returns the number of lookups that have found and missed their keys...
+  def get_lookup_counts(self) -> dict:
+    return {
+      'hits': self.__hit_count,
+      'misses': self.__miss_count,
+    }
+
+  # returns the entries as plain dictionary...
+  def to_dict(self) -> dict:
+    return dict(self)
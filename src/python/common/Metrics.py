@@ -0,0 +1,96 @@
+import os
+import threading
+
+try:
+  # 'resource' module is not available on windows...
+  import resource
+except ImportError:
+  resource = None
+
+# in-memory counters of the python loader...
+class Metrics:
+
+  # initializing metrics...
+  def __init__(self):
+    # lock for thread synchronization...
+    self.__lock = threading.Lock()
+    # holds counters by name...
+    self.__counters = {}
+    # holds cache statistics by cache namespace...
+    self.__cache_statistics = {}
+    # holds the number of recycled workers by reason...
+    self.__worker_recycles = {}
+
+  # increments counter by the provided amount...
+  def increment(self, counter_name: str, amount: int = 1):
+    with self.__lock:
+      self.__counters[counter_name] = self.__counters.get(counter_name, 0) + amount
+
+  # retrieves value of a counter...
+  def get(self, counter_name: str) -> int:
+    with self.__lock:
+      return self.__counters.get(counter_name, 0)
+
+  # records the number of cache hits and misses for the namespace...
+  def record_cache_lookups(self, namespace: str, hit_count: int, miss_count: int):
+    with self.__lock:
+      cache_statistics = self.__get_cache_statistics(namespace)
+      cache_statistics['hits'] += hit_count
+      cache_statistics['misses'] += miss_count
+
+  # records the size of the namespace and the number of evicted entries...
+  def record_cache_update(self, namespace: str, size: int, evictions: int = 0):
+    with self.__lock:
+      cache_statistics = self.__get_cache_statistics(namespace)
+      cache_statistics['evictions'] += evictions
+      cache_statistics['size'] = size
+
+  # records that a worker has been recycled...
+  def record_worker_recycle(self, reason: str):
+    with self.__lock:
+      self.__worker_recycles[reason] = self.__worker_recycles.get(reason, 0) + 1
+
+  # returns a snapshot of all the metrics as dictionary...
+  def to_dict(self, **gauges) -> dict:
+    with self.__lock:
+      counters = dict(self.__counters)
+      cache_statistics = { namespace: dict(statistics) for namespace, statistics in self.__cache_statistics.items() }
+      worker_recycles = dict(self.__worker_recycles)
+
+    return {
+      **counters,
+      **gauges,
+      'cache': cache_statistics,
+      'workerRecycles': worker_recycles,
+      'residentSetSizeInBytes': get_resident_set_size(),
+    }
+
+  # NOTE: must be called while holding the lock...
+  def __get_cache_statistics(self, namespace: str) -> dict:
+    cache_statistics = self.__cache_statistics.get(namespace)
+
+    if cache_statistics is None:
+      cache_statistics = { 'hits': 0, 'misses': 0, 'evictions': 0, 'size': 0 }
+      self.__cache_statistics[namespace] = cache_statistics
+
+    return cache_statistics
+
+# returns resident set size of the current process in bytes...
+def get_resident_set_size() -> int:
+  try:
+    # on linux, current resident set size is read from '/proc'...
+    with open('/proc/self/statm') as file_handle:
+      resident_pages = int(file_handle.read().split()[1])
+
+    return resident_pages * os.sysconf('SC_PAGE_SIZE')
+  except:
+    pass
+
+  # if '/proc' is not available, we shall fall back to peak resident set size...
+  if resource is None:
+    return 0
+
+  maximum_resident_set_size = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+  # NOTE: macOS reports in bytes whereas others report in kilobytes...
+  return maximum_resident_set_size if os.uname().sysname == 'Darwin' else maximum_resident_set_size * 1024
@@ -0,0 +1,312 @@
+import sys
+import bisect
+import itertools
+import json
+import Utilities
+
+EQUALITY_OPERATORS = ['eq']
+RANGE_OPERATORS = ['lt', 'lte', 'gt', 'gte', 'between']
+PREFIX_OPERATORS = ['prefix']
+# estimated memory (128 MB) that rows and indexes of the cached files may occupy.
+# NOTE: this is kept well below the resident set size at which workers are recycled...
+MAXIMUM_CACHED_FILES_SIZE_IN_BYTES = 134217728
+# estimated memory occupied by each position of an index...
+INDEX_POSITION_SIZE_IN_BYTES = 36
+# rows and indexes of the recently queried files by MD5 hash.
+# NOTE: queries of a file are always executed by the same long-lived pool
+# worker so this cache outlives the child process of a single request...
+CACHED_FILES = {}
+
+# parses query provided with function arguments.
+# NOTE: query may arrive as JSON string (e.g. multipart form field)...
+def parse_query(query) -> dict:
+  # if query is not provided, we shall return None...
+  if query is None or query == '':
+    return None
+
+  # if query is a string, we shall parse it as JSON...
+  if isinstance(query, str):
+    query = json.loads(query)
+
+  if not isinstance(query, dict):
+    raise ValueError('Query must be an object.')
+
+  columns = query.get('columns')
+
+  if columns is not None and (not isinstance(columns, list) or not all(isinstance(column, str) for column in columns)):
+    raise ValueError('Columns must be a list of column names.')
+
+  sort = query.get('sort')
+
+  if sort is not None and (not isinstance(sort, dict) or not isinstance(sort.get('column'), str)):
+    raise ValueError('Sort must be an object containing column name.')
+
+  offset = parse_non_negative_integer(query.get('offset'), 'Offset')
+  limit = parse_non_negative_integer(query.get('limit'), 'Limit')
+  filters = query.get('filters') or []
+
+  if not isinstance(filters, list):
+    raise ValueError('Filters must be a list.')
+
+  for query_filter in filters:
+    if not isinstance(query_filter, dict) or not isinstance(query_filter.get('column'), str):
+      raise ValueError('Each filter must be an object containing column name.')
+
+    operator = query_filter.get('operator', 'eq')
+
+    if operator not in EQUALITY_OPERATORS + RANGE_OPERATORS + PREFIX_OPERATORS:
+      raise ValueError(f'Filter operator "{operator}" is not supported.')
+
+    value = query_filter.get('value')
+
+    if operator == 'between':
+      if not isinstance(value, list) or len(value) != 2 or not all(is_scalar(bound) for bound in value):
+        raise ValueError('Value of "between" filter must be a list containing lower and upper bounds.')
+    elif not is_scalar(value):
+      raise ValueError(f'Value of "{operator}" filter must be a string or a number.')
+
+  return {
+    'columns': columns,
+    'filters': filters,
+    'sort': sort,
+    'offset': 0 if offset is None else offset,
+    'limit': limit,
+  }
+
+# checks if value is a string or a number...
+def is_scalar(value) -> bool:
+  return isinstance(value, (str, int, float)) and not isinstance(value, bool)
+
+# parses a value that must be a non-negative integer (if provided)...
+def parse_non_negative_integer(value, name: str) -> int:
+  if value is None:
+    return None
+
+  try:
+    # NOTE: booleans and fractions are not accepted...
+    if isinstance(value, bool) or (isinstance(value, float) and not value.is_integer()):
+      raise ValueError()
+
+    value = int(value)
+  except (TypeError, ValueError):
+    raise ValueError(f'{name} must be a non-negative integer.')
+
+  if value < 0:
+    raise ValueError(f'{name} must be a non-negative integer.')
+
+  return value
+
+# executes query against a CSV file and returns the matching rows along with
+# the total number of matches. rows and indexes of the file are cached by MD5 hash...
+def query_csv_file(request: dict):
+  cache_key = request.get('md5Hash')
+  # removing the file from cache so that it is placed last (i.e. most recently used)...
+  cached_file = None if cache_key is None else CACHED_FILES.pop(cache_key, None)
+
+  # if the file has not been cached yet...
+  if cached_file is None:
+    rows = Utilities.read_csv_file(request['filePath'])
+    cached_file = {
+      'rows': rows,
+      'indexes': {},
+      'sizeInBytes': estimate_rows_size(rows),
+    }
+
+  indexes: dict = cached_file['indexes']
+  index_keys = set(indexes.keys())
+  contents, match_count = execute_query(cached_file['rows'], request['query'], indexes)
+
+  # adds the estimated size of the newly built indexes...
+  for index_key in indexes.keys() - index_keys:
+    cached_file['sizeInBytes'] += estimate_index_size(index_key, indexes[index_key])
+
+  if cache_key is not None:
+    CACHED_FILES[cache_key] = cached_file
+
+    # least recently used files are evicted first. a file that alone
+    # exceeds the maximum size is evicted right away...
+    while sum(cached_file['sizeInBytes'] for cached_file in CACHED_FILES.values()) > MAXIMUM_CACHED_FILES_SIZE_IN_BYTES:
+      del CACHED_FILES[next(iter(CACHED_FILES))]
+
+  return contents, match_count
+
+# estimates memory occupied by rows read from a CSV file.
+# NOTE: column names are shared by all the rows...
+def estimate_rows_size(rows: list) -> int:
+  size = sys.getsizeof(rows)
+
+  for row in rows:
+    size += sys.getsizeof(row) + sum(sys.getsizeof(value) for value in row.values())
+
+  return size
+
+# estimates memory occupied by an index...
+def estimate_index_size(index_key: str, index: dict) -> int:
+  # hash index maps values of the rows to lists of positions...
+  if index_key.startswith('hash:'):
+    return sys.getsizeof(index) + sum(sys.getsizeof(positions) + len(positions) * INDEX_POSITION_SIZE_IN_BYTES for positions in index.values())
+
+  # keys of sorted index are either numbers or values of the rows...
+  position_count = len(index['positions']) + len(index['unordered_positions'])
+
+  return sys.getsizeof(index['keys']) + sys.getsizeof(index['positions']) + sys.getsizeof(index['unordered_positions']) + position_count * INDEX_POSITION_SIZE_IN_BYTES
+
+# executes query against rows using (and lazily building) indexes.
+# returns the matching rows along with the total number of matches...
+def execute_query(rows: list, query: dict, indexes: dict):
+  # positions of the rows that satisfy all the filters...
+  matching_positions = None
+  # filters are evaluated one by one and their results are intersected...
+  for query_filter in query['filters']:
+    positions = find_positions(rows, indexes, query_filter)
+    matching_positions = positions if matching_positions is None else matching_positions & positions
+
+    # no row can match any more...
+    if len(matching_positions) == 0:
+      break
+
+  match_count = len(rows) if matching_positions is None else len(matching_positions)
+  sort: dict = query['sort']
+
+  if sort is not None:
+    # positions are taken in the order of the sorted index...
+    sorted_index = get_sorted_index(rows, indexes, sort['column'])
+    ordered_positions = reversed(sorted_index['positions']) if sort.get('order') == 'desc' else iter(sorted_index['positions'])
+    # cells that cannot be ordered are placed last regardless of the order...
+    ordered_positions = itertools.chain(ordered_positions, sorted_index['unordered_positions'])
+
+    if matching_positions is not None:
+      ordered_positions = (position for position in ordered_positions if position in matching_positions)
+  elif matching_positions is None:
+    ordered_positions = range(len(rows))
+  else:
+    ordered_positions = sorted(matching_positions)
+
+  # applies offset and limit without visiting the rest of the positions...
+  limit = query['limit']
+  offset = query['offset']
+  ordered_positions = itertools.islice(ordered_positions, offset, None if limit is None else offset + limit)
+  columns: list = query['columns']
+
+  if columns is None:
+    results = [rows[position] for position in ordered_positions]
+  else:
+    results = [{ column: rows[position].get(column) for column in columns } for position in ordered_positions]
+
+  return results, match_count
+
+# returns positions of the rows that satisfy a filter...
+def find_positions(rows: list, indexes: dict, query_filter: dict) -> set:
+  column = query_filter['column']
+  operator = query_filter.get('operator', 'eq')
+  value = query_filter.get('value')
+
+  if operator in EQUALITY_OPERATORS:
+    return set(get_hash_index(rows, indexes, column).get(str(value), []))
+
+  if operator in PREFIX_OPERATORS:
+    sorted_index = get_sorted_index(rows, indexes, column, True)
+    prefix = str(value)
+    start = bisect.bisect_left(sorted_index['keys'], prefix)
+    end = start
+
+    # keys that start with the prefix are placed consecutively...
+    while end < len(sorted_index['keys']) and sorted_index['keys'][end].startswith(prefix):
+      end += 1
+
+    return set(sorted_index['positions'][start:end])
+
+  sorted_index = get_sorted_index(rows, indexes, column)
+  keys = sorted_index['keys']
+  to_key = lambda value: to_range_key(value, sorted_index['is_numeric'], operator, column)
+  start = 0
+  end = len(keys)
+
+  if operator == 'between':
+    start = bisect.bisect_left(keys, to_key(value[0]))
+    end = bisect.bisect_right(keys, to_key(value[1]))
+  elif operator == 'gt':
+    start = bisect.bisect_right(keys, to_key(value))
+  elif operator == 'gte':
+    start = bisect.bisect_left(keys, to_key(value))
+  elif operator == 'lt':
+    end = bisect.bisect_left(keys, to_key(value))
+  elif operator == 'lte':
+    end = bisect.bisect_right(keys, to_key(value))
+
+  return set(sorted_index['positions'][start:end])
+
+# returns hash index of the column (maps value to row positions)...
+def get_hash_index(rows: list, indexes: dict, column: str) -> dict:
+  index_key = f'hash:{column}'
+  hash_index = indexes.get(index_key)
+
+  if hash_index is None:
+    hash_index = {}
+
+    for position, row in enumerate(rows):
+      hash_index.setdefault(row.get(column, ''), []).append(position)
+
+    indexes[index_key] = hash_index
+
+  return hash_index
+
+# converts value of a range filter to the type of the keys of the sorted index...
+def to_range_key(value, is_numeric: bool, operator: str, column: str):
+  if is_numeric:
+    number = None if isinstance(value, bool) else to_number(value)
+
+    if number is None:
+      raise ValueError(f'Value of "{operator}" filter must be a number as column "{column}" is numeric.')
+
+    return number
+
+  # numbers are not compared against text as the results would be in textual order...
+  if not isinstance(value, str):
+    raise ValueError(f'Value of "{operator}" filter must be a string as column "{column}" is not numeric.')
+
+  return value
+
+# converts value to number. returns None if the value is not a number...
+def to_number(value):
+  try:
+    number = float(value)
+  except (TypeError, ValueError):
+    return None
+
+  # 'nan' cannot be ordered...
+  return None if number != number else number
+
+# returns sorted index of the column. columns whose non-empty cells are mostly numbers
+# are sorted numerically unless textual order is requested. cells that cannot be
+# ordered (i.e. empty cells and text in numeric columns) are kept separately...
+def get_sorted_index(rows: list, indexes: dict, column: str, is_textual: bool = False) -> dict:
+  index_key = f'{"text" if is_textual else "sorted"}:{column}'
+  sorted_index = indexes.get(index_key)
+
+  if sorted_index is not None:
+    return sorted_index
+
+  values = [row.get(column) or '' for row in rows]
+  is_numeric = False
+
+  if is_textual:
+    # every cell is ordered in textual order (required for prefix filters)...
+    keys = values
+  else:
+    numbers = [to_number(value) for value in values]
+    number_count = sum(1 for number in numbers if number is not None)
+    non_empty_value_count = sum(1 for value in values if value != '')
+    is_numeric = number_count > 0 and number_count * 2 >= non_empty_value_count
+    keys = numbers if is_numeric else [None if value == '' else value for value in values]
+
+  positions = sorted((position for position in range(len(keys)) if keys[position] is not None), key=lambda position: keys[position])
+  sorted_index = {
+    'is_numeric': is_numeric,
+    'keys': [keys[position] for position in positions],
+    'positions': positions,
+    'unordered_positions': [position for position in range(len(keys)) if keys[position] is None],
+  }
+  indexes[index_key] = sorted_index
+
+  return sorted_index
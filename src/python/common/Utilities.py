@@ -1,3 +1,4 @@
+import os
 import csv
 import traceback
 
@@ -13,6 +14,14 @@ def get_formatted_exception():
   # otheriwse, we'll return the formatted exception...
   return formatted_exception
 
+# returns value of an environment variable as integer. default value is
+# returned if the environment variable is not set or is not an integer...
+def get_integer_environment_variable(name: str, default_value: int) -> int:
+  try:
+    return int(os.environ[name])
+  except (KeyError, ValueError):
+    return default_value
+
 # reads rows from CSV file as a list where each item contains a row...
 def read_rows_from_csv_file(file_path: str, separator: str = ','):
   # opens a file handle for CSV file...
@@ -1,4 +1,5 @@
 import Utilities
+import Query
 
 def list(arguments):
   # retrieves function arguments from arguments...
@@ -7,10 +8,29 @@ def list(arguments):
   file_infos = function_arguments['$fileInfos']
   # retrieves the first file info...
   file_info = file_infos[0]
-  # reads CSV contents from file...
-  contents = Utilities.read_csv_file(file_info['filePath'])
+  # parses query (if provided) from function arguments...
+  query = Query.parse_query(function_arguments.get('query'))
+
+  # if no query is provided, we shall return the whole file...
+  if query is None:
+    # reads CSV contents from file...
+    contents = Utilities.read_csv_file(file_info['filePath'])
+
+    # returns the contents read from the uploaded file...
+    return {
+      'contents': contents,
+    }
+
+  # query is evaluated by a pool worker so that rows and indexes are cached
+  # across requests and only the matching rows are sent back. queries of the
+  # same file are evaluated by the same worker (and hence the same cache)...
+  contents, match_count = arguments['parallel'].map(Query.query_csv_file, [{
+    'filePath': file_info['filePath'],
+    'md5Hash': file_info.get('md5Hash'),
+    'query': query,
+  }], 1, file_info.get('md5Hash'))[0]
 
-  # returns the contents read from the uploaded file...
   return {
     'contents': contents,
+    'matchCount': match_count,
   }
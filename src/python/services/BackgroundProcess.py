@@ -7,6 +7,7 @@ import importlib.util
 import multiprocessing
 import Utilities
 from multiprocessing.connection import Connection
+from CacheDictionary import CacheDictionary
 from Logger import LoggerLogLevels
 
 class BackgroundProcess:
@@ -51,6 +52,8 @@ class BackgroundProcess:
     # retrieving child connection object from function arguments...
     # NOTE: child connection shall never be None...
     child_connection: Connection = arguments.get('connection')
+    # retrieving cache that counts the lookups performed by the function...
+    cache_dictionary: CacheDictionary = arguments.get('cache')
 
     try:
       self.__send_log_request_to_parent(child_connection, LoggerLogLevels.Information, f'Dynamically executing function "{function_name}()" from "{module_path}" for request ID {request_id} with the following arguments.', function_arguments)
@@ -78,6 +81,10 @@ class BackgroundProcess:
           # we shall delete cache from the result...
           del result['cache']
 
+        # cache is sent to the parent process as plain dictionary...
+        if isinstance(cache, CacheDictionary):
+          cache = cache.to_dict()
+
       return {
         'hasSucceeded': True,
         'result': result,
@@ -87,7 +94,8 @@ class BackgroundProcess:
           'module_path': module_path,
           'function_name': function_name,
           'function_arguments': function_arguments,
-          'cache': cache
+          'cache': cache,
+          'cache_lookups': cache_dictionary.get_lookup_counts(),
         },
       }
     except:
@@ -96,7 +104,8 @@ class BackgroundProcess:
       exception_response['additional_data'] = {
         'module_path': module_path,
         'function_name': function_name,
-        'function_arguments': function_arguments
+        'function_arguments': function_arguments,
+        'cache_lookups': cache_dictionary.get_lookup_counts(),
       }
 
       return exception_response
@@ -119,6 +128,8 @@ class BackgroundProcess:
 
     # writes response to parent process...
     child_connection.send(response)
+    # closes the dedicated channel so that parent process knows this process is done...
+    child_connection.close()
 
   # starts the background process...
   def start(self):
@@ -7,21 +7,30 @@ sys.path.append('./src/python/scripts')
 import json
 import threading
 import multiprocessing
-import time
+import multiprocessing.connection
 import Utilities
 from queue import Queue
 from Logger import Logger, LoggerLogLevels
+from Metrics import Metrics
+from CacheDictionary import CacheDictionary
 from BackgroundProcess import BackgroundProcess
+from Parallel import Parallel
+from WorkerPool import WorkerPool, DEFAULT_WORKER_MAXIMUM_TASK_COUNT, DEFAULT_WORKER_MAXIMUM_TASK_COUNT_JITTER, DEFAULT_WORKER_MAXIMUM_RESIDENT_SET_SIZE_IN_BYTES
 
-PARENT_CONNECTION_POLL_TIMEOUT_IN_MILLISECONDS = 10
 CHILD_PROCESS_SPAWNER_THREAD_REQUEST_DATA_RECEIVE_TIMEOUT_IN_SECONDS = 0.25
-BACKGROUND_PROCESS_SPAWN_WAIT_POLL_TIMEOUT_IN_SECONDS = 0.1
-BACKGROUND_PROCESS_SPAWN_WAIT_ADDITIONAL_TIMEOUT_IN_SECONDS = 1
 LOG_FILE_DIRECTORY_PATH = 'application-data/logs'
 RESPONSE_START_FLAG = '<------------------- START ------------------->'
 RESPONSE_END_FLAG = '<------------------- END ------------------->'
+# environment variables through which the parent process configures the workers...
+WORKER_MAXIMUM_TASK_COUNT_ENVIRONMENT_VARIABLE = 'PYNODE_WORKER_MAXIMUM_TASK_COUNT'
+WORKER_MAXIMUM_TASK_COUNT_JITTER_ENVIRONMENT_VARIABLE = 'PYNODE_WORKER_MAXIMUM_TASK_COUNT_JITTER'
+WORKER_MAXIMUM_RESIDENT_SET_SIZE_ENVIRONMENT_VARIABLE = 'PYNODE_WORKER_MAXIMUM_RESIDENT_SET_SIZE'
+# arguments of child processes that are not logged...
+UNLOGGED_ARGUMENT_KEYS = ['cache', 'connection', 'parallel']
 # cached data shall be stored in this dictionary...
 CACHE = {}
+# runtime counters of the loader shall be stored here...
+METRICS = Metrics()
 
 # loader...
 class Loader:
@@ -32,14 +41,31 @@ class Loader:
     self.__is_disposed = False
     # flag that indicates if python loader is running...
     self.__is_running = False
-    # flag that indicates if background process has spawned...
-    self.__has_process_spawned = False
     # global logger...
     self.__logger = Logger.get_instance(LOG_FILE_DIRECTORY_PATH)
     # queue that holds child process spawn requests...
     self.__child_process_spawn_requests = Queue()
-    # creating pipe to communicate with child process...
-    self.__parent_connection, self.__child_connection = multiprocessing.Pipe(duplex=False)
+    # channels of the child processes that have not exited yet, keyed by the
+    # connections through which the child processes send data...
+    self.__child_channels = {}
+    # lock for synchronizing access to child channels...
+    self.__child_channels_lock = threading.Lock()
+    # pipe through which the reader thread is woken up when a child channel
+    # is registered or the loader is being disposed...
+    self.__reader_wake_up_connection, self.__reader_wake_up_request_connection = multiprocessing.Pipe(duplex=False)
+    # lock that prevents responses from interleaving on standard output...
+    self.__standard_output_lock = threading.Lock()
+    # IDs of the requests that have been received but not answered yet...
+    self.__unanswered_request_ids = set()
+    # pool of workers that execute parallel work requested by child processes...
+    self.__worker_pool = WorkerPool(METRICS,
+      maximum_task_count=Utilities.get_integer_environment_variable(WORKER_MAXIMUM_TASK_COUNT_ENVIRONMENT_VARIABLE, DEFAULT_WORKER_MAXIMUM_TASK_COUNT),
+      maximum_task_count_jitter=Utilities.get_integer_environment_variable(WORKER_MAXIMUM_TASK_COUNT_JITTER_ENVIRONMENT_VARIABLE, DEFAULT_WORKER_MAXIMUM_TASK_COUNT_JITTER),
+      maximum_resident_set_size=Utilities.get_integer_environment_variable(WORKER_MAXIMUM_RESIDENT_SET_SIZE_ENVIRONMENT_VARIABLE, DEFAULT_WORKER_MAXIMUM_RESIDENT_SET_SIZE_IN_BYTES))
+    # thread that spawns child processes...
+    self.__child_process_spawner_thread: threading.Thread = None
+    # thread that reads responses from child processes...
+    self.__child_process_response_reader_thread: threading.Thread = None
 
   # reads data from standard input...
   def __read_from_standard_input(self):
@@ -102,14 +128,20 @@ class Loader:
     self.__logger.information(__file__, 'Response data is prepared for writing...')
     self.__logger.information(__file__, 'Writing prepared response data to standard system output...')
 
-    # writing JSON response to standard output...
-    sys.stdout.write(f'{RESPONSE_START_FLAG}{data_as_json}{RESPONSE_END_FLAG}')
+    # responses may be written from multiple threads...
+    with self.__standard_output_lock:
+      # writing JSON response to standard output...
+      sys.stdout.write(f'{RESPONSE_START_FLAG}{data_as_json}{RESPONSE_END_FLAG}')
 
-    self.__logger.information(__file__, 'Response data written to standard system output...')
-    self.__logger.information(__file__, 'Flushing standard system output...')
+      self.__logger.information(__file__, 'Response data written to standard system output...')
+      self.__logger.information(__file__, 'Flushing standard system output...')
 
-    # flushing standard output...
-    sys.stdout.flush()
+      # flushing standard output...
+      sys.stdout.flush()
+
+      # the request has been answered...
+      if isinstance(data, dict):
+        self.__unanswered_request_ids.discard(data.get('request_id'))
 
     self.__logger.information(__file__, 'Response data has been written successfully to standard system output...')
 
@@ -122,60 +154,123 @@ class Loader:
 
     self.__logger.log(log_level, current_file_path, *data)
 
+  # handles data received from a child process...
+  def __handle_child_process_response(self, child_channel: dict, response: dict):
+    # if received response contains key 'shall_log' with value 'True'...
+    if response.get('shall_log') is True:
+      self.__write_child_process_log(response)
+
+      return
+
+    # if received response contains key 'has_spawned' with value 'True'...
+    if response.get('has_spawned') is True:
+      # we shall let the main thread know that this child process has spawned...
+      child_channel['has_spawned'].set()
+
+      return
+
+    child_channel['has_responded'] = True
+
+    # retrieves additional data and it is always present...
+    additional_data = response.get('additional_data')
+
+    # if additional data is not None...
+    if additional_data is not None:
+      # we shall delete additional data...
+      del response['additional_data']
+
+    # writes response to standard output...
+    self.__write_to_standard_output(response)
+
+    # retrieves the number of cache lookups performed by the function...
+    cache_lookups = additional_data.get('cache_lookups')
+
+    if isinstance(cache_lookups, dict):
+      METRICS.record_cache_lookups(Loader.__prepare_cache_key(additional_data['function_name'], additional_data['module_path']), cache_lookups['hits'], cache_lookups['misses'])
+
+    # retrieves cache from additional data...
+    cache = additional_data.get('cache')
+
+    # if cache is not None and is an instance of dictionary...
+    if cache is not None and isinstance(cache, dict):
+      # we shall update current cache with the new one...
+      Loader.__set_cached_data(additional_data['function_name'], additional_data['module_path'], cache)
+
+  # forgets the channel of a child process that has exited...
+  def __close_child_channel(self, connection: multiprocessing.connection.Connection):
+    with self.__child_channels_lock:
+      child_channel = self.__child_channels.pop(connection)
+
+    connection.close()
+
+    # main thread shall not wait for a child process that has exited...
+    child_channel['has_spawned'].set()
+
+    # if the child process has exited without sending the response...
+    if not child_channel['has_responded']:
+      request_id = child_channel['request_id']
+
+      self.__logger.error(__file__, f'Child process has exited without sending response for request ID {request_id}.')
+
+      self.__write_to_standard_output({
+        'hasSucceeded': False,
+        'exception': 'Child process has exited without sending the response.',
+        'request_id': request_id,
+      })
+
   # reads responses from child processes...
   def __read_responses_from_child_processes(self):
     self.__logger.information(__file__, 'Background thread is listening for child process response...')
 
     # indefinitely waits for data from child processes...
     while self.__is_running:
-      # checks if response is available...
-      if self.__parent_connection.poll(timeout=PARENT_CONNECTION_POLL_TIMEOUT_IN_MILLISECONDS):
-        self.__logger.information(__file__, 'Background thread needs to receive response from child process now...')
+      with self.__child_channels_lock:
+        connections = list(self.__child_channels.keys())
 
-        try:
-          # if response is found, we'll store this...
-          response = self.__parent_connection.recv()
-        except:
-          self.__logger.error(__file__, 'An error occurred while receiving response from the child process.', Utilities.get_formatted_exception())
+      # waits until any of the child processes sends data or exits, or
+      # the reader is woken up to wait on the newly registered channels...
+      for connection in multiprocessing.connection.wait(connections + [self.__reader_wake_up_connection]):
+        if connection is self.__reader_wake_up_connection:
+          # discards all the pending wake up requests...
+          while connection.poll():
+            connection.recv_bytes()
 
           continue
 
-        self.__logger.information(__file__, 'Background thread has received the following response from the child process.', response)
+        child_channel = self.__child_channels[connection]
 
-        # if received response contains key 'shall_log' with value 'True'...
-        if response.get('shall_log') is True:
-          self.__write_child_process_log(response)
+        try:
+          response = connection.recv()
+        except EOFError:
+          # child process has exited and closed its end of the channel...
+          self.__close_child_channel(connection)
 
           continue
-
-        # if received response contains key 'has_spawned' with value 'True'...
-        if response.get('has_spawned') is True:
-          # we shall set the value of the flag '__has_process_spawned' to 'True'...
-          self.__has_process_spawned = True
+        except:
+          self.__logger.error(__file__, 'An error occurred while receiving response from the child process.', Utilities.get_formatted_exception())
 
           continue
 
-        # retrieves additional data and it is always present...
-        additional_data = response.get('additional_data')
+        # NOTE: cache is not logged as it may be arbitrarily large...
+        self.__logger.information(__file__, 'Background thread has received the following response from the child process.', Loader.__exclude_keys(response, ['additional_data']))
 
-        # if additional data is not None...
-        if additional_data is not None:
-          # we shall delete additional data...
-          del response['additional_data']
+        self.__handle_child_process_response(child_channel, response)
 
-        # writes response to standard output...
-        self.__write_to_standard_output(response)
+  # wakes up the reader thread.
+  # NOTE: must not be called from more than one thread at a time...
+  def __wake_up_reader(self):
+    self.__reader_wake_up_request_connection.send_bytes(b'1')
 
-        # retrieves cache from additional data...
-        cache = additional_data.get('cache')
+  # returns a shallow copy of the dictionary without the provided keys...
+  @staticmethod
+  def __exclude_keys(data: dict, keys: list) -> dict:
+    if not isinstance(data, dict):
+      return data
 
-        # if cache is not None and is an instance of dictionary...
-        if cache is not None and isinstance(cache, dict):
-          # we shall update current cache with the new one...
-          Loader.__set_cached_data(additional_data['function_name'], additional_data['module_path'], cache)
+    return { key: value for key, value in data.items() if key not in keys }
 
   # spawns a child process...
-  def __spawn_child_process(self, arguments: dict):
+  def __spawn_child_process(self, arguments: dict, has_spawned: threading.Event):
     # reading request ID...
     request_id = arguments.get('requestId')
     # reading function name from request data...
@@ -191,18 +286,39 @@ class Loader:
     arguments['request_id'] = request_id
     arguments['function_arguments'] = function_arguments
 
+    # creating a dedicated pipe to communicate with the child process...
+    parent_connection, child_connection = multiprocessing.Pipe(duplex=False)
+
     # sets child connection to data...
-    arguments['connection'] = self.__child_connection
-    # adding cache to data...
-    arguments['cache'] = Loader.__retrieve_cached_data(function_name, module_path)
+    arguments['connection'] = child_connection
+    # adding cache to data. lookups performed by the function are counted...
+    arguments['cache'] = CacheDictionary(Loader.__retrieve_cached_data(function_name, module_path))
+    # lets the function distribute work across the worker pool...
+    arguments['parallel'] = Parallel(self.__worker_pool.get_task_queue(), self.__worker_pool.get_worker_task_queues())
 
-    self.__logger.information(__file__, 'Background thread is spawning new process with the following data...', arguments)
+    self.__logger.information(__file__, 'Background thread is spawning new process with the following data...', Loader.__exclude_keys(arguments, UNLOGGED_ARGUMENT_KEYS))
 
     # initiates background process...
     backgroundProcess = BackgroundProcess(arguments)
     backgroundProcess.start()
 
-    self.__logger.information(__file__, 'Background thread has spawned new process with the following data...', arguments)
+    # only the child process shall hold the sending end so that
+    # the channel reaches end of file when the child process exits...
+    child_connection.close()
+
+    with self.__child_channels_lock:
+      self.__child_channels[parent_connection] = {
+        'request_id': request_id,
+        'has_spawned': has_spawned,
+        'has_responded': False,
+      }
+
+    # the reader thread shall wait on the newly registered channel as well...
+    self.__wake_up_reader()
+
+    METRICS.increment('processSpawns')
+
+    self.__logger.information(__file__, 'Background thread has spawned new process with the following data...', Loader.__exclude_keys(arguments, UNLOGGED_ARGUMENT_KEYS))
 
     return backgroundProcess
 
@@ -215,28 +331,54 @@ class Loader:
 
       try:
         # receives request datum from request data queue...
-        child_process_spawn_request = self.__child_process_spawn_requests.get(timeout=CHILD_PROCESS_SPAWNER_THREAD_REQUEST_DATA_RECEIVE_TIMEOUT_IN_SECONDS)
+        arguments, has_spawned = self.__child_process_spawn_requests.get(timeout=CHILD_PROCESS_SPAWNER_THREAD_REQUEST_DATA_RECEIVE_TIMEOUT_IN_SECONDS)
       except:
         # self.__logger.warning(__file__, 'An error occurred while processing child process spawn request...', __get_formatted_exception())
 
         # we shall continue iteration if no data is read or during exception...
         continue
 
-      # spawns a child process...
-      self.__spawn_child_process(child_process_spawn_request)
+      try:
+        # spawns a child process...
+        self.__spawn_child_process(arguments, has_spawned)
+      except:
+        self.__logger.error(__file__, 'An error occurred while spawning child process.', Utilities.get_formatted_exception())
+
+        # main thread shall not wait for a child process that could not be spawned...
+        has_spawned.set()
+
+        self.__write_to_standard_output({
+          'hasSucceeded': False,
+          'exception': Utilities.get_formatted_exception(),
+          'request_id': arguments.get('requestId'),
+        })
+
+  # writes runtime metrics of the loader to standard output...
+  def __write_metrics(self, request_id: str):
+    # counts the child processes that have not exited yet...
+    with self.__child_channels_lock:
+      running_process_count = len(self.__child_channels)
+
+    # counts the requests that have been received but not answered yet...
+    with self.__standard_output_lock:
+      unanswered_request_count = len(self.__unanswered_request_ids)
+
+    busy_worker_count = self.__worker_pool.get_busy_worker_count()
+
+    self.__write_to_standard_output({
+      'hasSucceeded': True,
+      'request_id': request_id,
+      'metrics': METRICS.to_dict(
+        queueDepth=unanswered_request_count,
+        runningProcesses=running_process_count,
+        busyWorkers=busy_worker_count,
+        idleWorkers=self.__worker_pool.get_size() - busy_worker_count),
+    })
 
   # waits until background process spawns...
-  def __wait_for_background_process_to_spawn(self):
-    # sets '__has_process_spawned' flag to false...
-    self.__has_process_spawned = False
-
-    # this while loop iterates until the value of the flag '__has_process_spawned' is True...
-    while self.__has_process_spawned is False:
-      # before checking the flag value, this thread shall sleep for a while...
-      time.sleep(BACKGROUND_PROCESS_SPAWN_WAIT_POLL_TIMEOUT_IN_SECONDS)
-
-    # waits for a few more milliseconds to be safe...
-    time.sleep(BACKGROUND_PROCESS_SPAWN_WAIT_ADDITIONAL_TIMEOUT_IN_SECONDS)
+  def __wait_for_background_process_to_spawn(self, has_spawned: threading.Event):
+    # the event is set once the child process reports through its own channel...
+    has_spawned.wait()
 
   # execution starts from this method...
   def execute(self):
@@ -248,15 +390,21 @@ class Loader:
     # setting 'isRunning' flag to true...
     self.__is_running = True
 
+    # workers are started before any thread so that they don't inherit locks held by those threads...
+    self.__worker_pool.start()
+
     # creating a thread to initiate child processes...
-    child_process_spawner_thread = threading.Thread(target=self.__handle_child_process_spawn_requests, daemon=False)
+    self.__child_process_spawner_thread = threading.Thread(target=self.__handle_child_process_spawn_requests, daemon=False)
     # starts listening for child process spawn requests...
-    child_process_spawner_thread.start()
+    self.__child_process_spawner_thread.start()
 
     # creating a thread to read response from child processes...
-    child_process_response_reader_thread = threading.Thread(target=self.__read_responses_from_child_processes, daemon=False)
+    self.__child_process_response_reader_thread = threading.Thread(target=self.__read_responses_from_child_processes, daemon=False)
     # starts listening from child processes...
-    child_process_response_reader_thread.start()
+    self.__child_process_response_reader_thread.start()
+
+    # lets the parent process know that requests can be processed now...
+    self.__write_to_standard_output({ 'ready': True })
 
     while self.__is_running:
       try:
@@ -277,11 +425,25 @@ class Loader:
 
           break
 
+        # metrics requests are served directly without spawning any process...
+        if data.get('metrics') == True:
+          self.__write_metrics(data.get('requestId'))
+
+          continue
+
+        METRICS.increment('requests')
+
+        with self.__standard_output_lock:
+          self.__unanswered_request_ids.add(data.get('requestId'))
+
         self.__logger.information(__file__, 'Received data is about to be placed on queue to be processed by the background thread...', data)
 
+        # event that is set when the child process for this request has spawned...
+        has_spawned = threading.Event()
+
         # placing data on queue. background thread shall receive
         # the data and perform further processing...
-        self.__child_process_spawn_requests.put(data)
+        self.__child_process_spawn_requests.put((data, has_spawned))
         
         self.__logger.information(__file__, 'Received data is successfully placed on queue to be processed by the background thread...', data)
         self.__logger.information(__file__, 'Waiting for background process to spawn...')
@@ -289,7 +451,7 @@ class Loader:
         # we need to pause execution of current thread in order for
         # our background process to be initiated properly. otherwise process spawn
         # gets blocked by 'self.__read_from_standard_input()' method...
-        self.__wait_for_background_process_to_spawn()
+        self.__wait_for_background_process_to_spawn(has_spawned)
 
         self.__logger.information(__file__, 'Background process spawned successfully...')
       except:
@@ -304,12 +466,30 @@ class Loader:
     self.__is_disposed = True
     # setting is running flag to false...
     self.__is_running = False
+
+    # background threads stop as soon as they notice that the flag is cleared.
+    # NOTE: the reader thread must not be waiting on the connections while they are being closed...
+    if self.__child_process_spawner_thread is not None:
+      self.__child_process_spawner_thread.join()
+
+    if self.__child_process_response_reader_thread is not None:
+      # reader thread may be waiting for child processes...
+      self.__wake_up_reader()
+      self.__child_process_response_reader_thread.join()
+
+    # stops the workers...
+    self.__worker_pool.dispose()
     # disposes python logger...
     self.__logger.dispose()
-    # disposes child process connection...
-    self.__child_connection.close()
-    # disposes parent process connection...
-    self.__parent_connection.close()
+    # disposes connections of the child processes...
+    with self.__child_channels_lock:
+      for connection in self.__child_channels:
+        connection.close()
+
+      self.__child_channels.clear()
+
+    self.__reader_wake_up_connection.close()
+    self.__reader_wake_up_request_connection.close()
 
   # prepares key for caching...
   @staticmethod
@@ -343,9 +523,14 @@ class Loader:
 
     # prepares cache key...
     cache_key = Loader.__prepare_cache_key(function_name, module_path)
+    # entries that are missing from the new cached data are considered evicted...
+    previously_cached_data = CACHE.get(cache_key) or {}
+    eviction_count = sum(1 for key in previously_cached_data if key not in cached_data)
     # sets cached data corresponding to the key...
     CACHE[cache_key] = cached_data
 
+    METRICS.record_cache_update(cache_key, len(cached_data), eviction_count)
+
 # entry point of the application...
 if __name__ == '__main__':
   # initializing loader...
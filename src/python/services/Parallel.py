@@ -0,0 +1,135 @@
+import itertools
+import zlib
+import multiprocessing
+import multiprocessing.connection
+from multiprocessing.reduction import ForkingPickler
+
+DEFAULT_CHUNK_SIZE = 64
+# number of chunks that may be in flight per worker of the pool...
+MAXIMUM_PENDING_CHUNKS_PER_WORKER = 2
+
+# distributes work of a script function across the workers of the loader...
+class Parallel:
+
+  def __init__(self, task_queue: multiprocessing.Queue, worker_task_queues: list):
+    self.__task_queue = task_queue
+    self.__worker_task_queues = worker_task_queues
+    self.__maximum_pending_chunk_count = max(1, len(worker_task_queues)) * MAXIMUM_PENDING_CHUNKS_PER_WORKER
+
+  # applies the function to each item and returns the results in order...
+  def map(self, function, iterable, chunk_size: int = DEFAULT_CHUNK_SIZE, key: str = None) -> list:
+    return list(self.imap(function, iterable, chunk_size, key))
+
+  # lazily applies the function to each item and yields the results in order.
+  # only a limited number of chunks are read from the iterable at a time.
+  # if key is provided, all the chunks are executed by the same worker as every
+  # other chunk with the same key so that data cached by the worker is reused...
+  def imap(self, function, iterable, chunk_size: int = DEFAULT_CHUNK_SIZE, key: str = None):
+    module_path, function_name = Parallel.__resolve_function(function)
+    task_queue = self.__get_task_queue(key)
+    # each pending chunk has its own pipe through which the worker sends the results...
+    pending_chunk_indexes = {}
+    # results that have been received out of order...
+    received_results = {}
+    submitted_chunk_count = 0
+    next_chunk_index = 0
+    chunks = Parallel.__split_into_chunks(iterable, max(1, chunk_size))
+    has_more_chunks = True
+
+    try:
+      while True:
+        # keeps the workers busy without reading the whole iterable into memory...
+        while has_more_chunks and submitted_chunk_count - next_chunk_index < self.__maximum_pending_chunk_count:
+          chunk = next(chunks, None)
+
+          if chunk is None:
+            has_more_chunks = False
+
+            break
+
+          result_reader = self.__submit_chunk(task_queue, submitted_chunk_count, module_path, function_name, chunk)
+          pending_chunk_indexes[result_reader] = submitted_chunk_count
+
+          submitted_chunk_count += 1
+
+        # if results of all the submitted chunks have been yielded, we're done...
+        if next_chunk_index == submitted_chunk_count:
+          break
+
+        # receives results until the next chunk in order is available...
+        while next_chunk_index not in received_results:
+          for result_reader in multiprocessing.connection.wait(list(pending_chunk_indexes.keys())):
+            chunk_index = pending_chunk_indexes.pop(result_reader)
+
+            try:
+              _, has_succeeded, result = result_reader.recv()
+            except EOFError:
+              # the worker is the only writer of the pipe so it has stopped without sending the results...
+              raise Exception(f'Worker has stopped while executing "{function_name}()" in parallel.')
+            finally:
+              result_reader.close()
+
+            if not has_succeeded:
+              raise Exception(f'An error occurred while executing "{function_name}()" in parallel.\n{result}')
+
+            received_results[chunk_index] = result
+
+        yield from received_results.pop(next_chunk_index)
+
+        next_chunk_index += 1
+    finally:
+      for result_reader in pending_chunk_indexes.keys():
+        result_reader.close()
+
+  # returns the queue of the worker that is responsible for the key.
+  # if no key is provided, the queue shared by all the workers is returned...
+  def __get_task_queue(self, key: str):
+    if key is None or len(self.__worker_task_queues) == 0:
+      return self.__task_queue
+
+    # NOTE: built-in hash() of strings differs between processes...
+    return self.__worker_task_queues[zlib.crc32(str(key).encode('utf-8')) % len(self.__worker_task_queues)]
+
+  # places the chunk on the task queue and returns the connection to receive the results from...
+  def __submit_chunk(self, task_queue: multiprocessing.Queue, chunk_index: int, module_path: str, function_name: str, chunk: list):
+    result_reader, result_writer = multiprocessing.Pipe(duplex=False)
+
+    try:
+      # the task is pickled right away so that the sending end of the pipe can be closed here.
+      # thus the worker holds the only sending end and the pipe reaches end of file if the
+      # worker stops before sending the results...
+      task = bytes(ForkingPickler.dumps((result_writer, chunk_index, module_path, function_name, chunk)))
+    except:
+      result_reader.close()
+
+      raise
+    finally:
+      result_writer.close()
+
+    task_queue.put(task)
+
+    return result_reader
+
+  # returns module path and name of a module level function...
+  @staticmethod
+  def __resolve_function(function):
+    function_name: str = getattr(function, '__qualname__', '')
+
+    # workers load the function by name so it must be defined at module level...
+    if not callable(function) or not hasattr(function, '__code__') or '.' in function_name or function_name == '<lambda>':
+      raise TypeError('Only functions defined at module level can be executed in parallel.')
+
+    return function.__code__.co_filename, function_name
+
+  # splits the iterable into lists of items...
+  @staticmethod
+  def __split_into_chunks(iterable, chunk_size: int):
+    iterator = iter(iterable)
+
+    while True:
+      chunk = list(itertools.islice(iterator, chunk_size))
+
+      if len(chunk) == 0:
+        return
+
+      yield chunk
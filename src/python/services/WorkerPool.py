@@ -0,0 +1,255 @@
+import sys
+
+sys.path.append('./src/python/common')
+sys.path.append('./src/python/services')
+
+import os
+import random
+import threading
+import importlib.util
+import multiprocessing
+import multiprocessing.connection
+import queue
+import Utilities
+from multiprocessing.reduction import ForkingPickler
+from Logger import Logger
+from Metrics import Metrics, get_resident_set_size
+
+WORKER_POOL_SIZE = os.cpu_count() or 1
+# workers are replaced by the supervisor thread while the main thread of the loader may be
+# blocked reading standard input. a worker forked at that moment would inherit the lock of
+# standard input and block forever while closing it. thus workers are started by a fork
+# server (if available) which does not run any other thread...
+WORKER_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else None
+WORKER_JOIN_TIMEOUT_IN_SECONDS = 5
+WORKER_SUPERVISION_POLL_TIMEOUT_IN_SECONDS = 0.5
+# by default, workers are recycled after executing this many tasks...
+DEFAULT_WORKER_MAXIMUM_TASK_COUNT = 1000
+# random number of tasks (up to this value) added to the maximum task count of each
+# worker so that the workers of the pool are not recycled at the same time...
+DEFAULT_WORKER_MAXIMUM_TASK_COUNT_JITTER = 100
+# by default, workers are recycled when their resident set size exceeds this value (512 MB)...
+DEFAULT_WORKER_MAXIMUM_RESIDENT_SET_SIZE_IN_BYTES = 536870912
+# exit codes that let the pool know why a worker has stopped...
+WORKER_EXIT_CODE_MAXIMUM_TASK_COUNT_REACHED = 3
+WORKER_EXIT_CODE_MAXIMUM_RESIDENT_SET_SIZE_EXCEEDED = 4
+WORKER_RECYCLE_REASONS = {
+  WORKER_EXIT_CODE_MAXIMUM_TASK_COUNT_REACHED: 'maximumTaskCount',
+  WORKER_EXIT_CODE_MAXIMUM_RESIDENT_SET_SIZE_EXCEEDED: 'maximumResidentSetSize',
+}
+
+# loads module from file location and caches it for subsequent tasks...
+def load_module(modules: dict, module_path: str):
+  module = modules.get(module_path)
+
+  if module is not None:
+    return module
+
+  # dynamically importing the module spec from file location...
+  module_spec = importlib.util.spec_from_file_location(os.path.splitext(os.path.basename(module_path))[0], module_path)
+  # creating module based on the spec...
+  module = importlib.util.module_from_spec(module_spec)
+  # executes the module in its own namespace...
+  module_spec.loader.exec_module(module)
+
+  modules[module_path] = module
+
+  return module
+
+# waits until a task is available on any of the queues and returns it.
+# tasks placed on the queue of the worker itself are preferred...
+def get_next_task(task_queue: multiprocessing.Queue, worker_task_queue: multiprocessing.Queue):
+  while True:
+    # NOTE: queues do not provide a public way to wait on more than one of them...
+    multiprocessing.connection.wait([worker_task_queue._reader, task_queue._reader])
+
+    for task_source in [worker_task_queue, task_queue]:
+      try:
+        return task_source.get(block=False)
+      except queue.Empty:
+        # the task may have been taken by another worker...
+        continue
+
+# executes tasks from the task queues until 'None' is received or
+# the worker needs to be recycled...
+def execute_tasks(task_queue: multiprocessing.Queue, worker_task_queue: multiprocessing.Queue, busy_workers, worker_index: int, maximum_task_count: int, maximum_resident_set_size: int):
+  # modules that have already been loaded by this worker...
+  modules = {}
+  task_count = 0
+
+  while True:
+    task = get_next_task(task_queue, worker_task_queue)
+
+    # 'None' is the signal to stop the worker...
+    if task is None:
+      break
+
+    try:
+      # tasks are pickled by the requesting process (see Parallel)...
+      result_connection, chunk_index, module_path, function_name, items = ForkingPickler.loads(task)
+    except:
+      # the requesting process has stopped (e.g. after a failed chunk) so nobody
+      # is waiting for the results of this task...
+      continue
+
+    busy_workers[worker_index] = 1
+
+    try:
+      module = load_module(modules, module_path)
+      function = getattr(module, function_name)
+      response = (chunk_index, True, [function(item) for item in items])
+    except:
+      response = (chunk_index, False, Utilities.get_formatted_exception())
+    finally:
+      busy_workers[worker_index] = 0
+
+    try:
+      # sends results of the chunk to the process that requested it...
+      result_connection.send(response)
+    except:
+      # the requesting process may have stopped waiting for the results...
+      pass
+    finally:
+      result_connection.close()
+
+    task_count += 1
+
+    # workers are only recycled between tasks so that no function is interrupted...
+    if task_count >= maximum_task_count:
+      sys.exit(WORKER_EXIT_CODE_MAXIMUM_TASK_COUNT_REACHED)
+
+    if get_resident_set_size() > maximum_resident_set_size:
+      sys.exit(WORKER_EXIT_CODE_MAXIMUM_RESIDENT_SET_SIZE_EXCEEDED)
+
+# pool of long-lived worker processes that execute chunks of work on behalf of child processes.
+# workers that have stopped (e.g. recycled) are replaced by the pool...
+class WorkerPool:
+
+  def __init__(self, metrics: Metrics, size: int = WORKER_POOL_SIZE,
+    maximum_task_count: int = DEFAULT_WORKER_MAXIMUM_TASK_COUNT,
+    maximum_task_count_jitter: int = DEFAULT_WORKER_MAXIMUM_TASK_COUNT_JITTER,
+    maximum_resident_set_size: int = DEFAULT_WORKER_MAXIMUM_RESIDENT_SET_SIZE_IN_BYTES):
+    self.__size = size
+    self.__maximum_task_count = maximum_task_count
+    self.__maximum_task_count_jitter = maximum_task_count_jitter
+    self.__maximum_resident_set_size = maximum_resident_set_size
+    self.__metrics = metrics
+    self.__logger = Logger.get_instance()
+    self.__is_running = False
+    self.__context = multiprocessing.get_context(WORKER_START_METHOD)
+    # queue that holds tasks to be executed by any of the workers...
+    self.__task_queue = self.__context.Queue()
+    # queues (by worker index) that hold tasks to be executed by specific workers.
+    # NOTE: these queues outlive the workers so that the replacement of a worker
+    # executes the tasks that have been placed for the stopped one...
+    self.__worker_task_queues = [self.__context.Queue() for _ in range(size)]
+    # flags (by worker index) that indicate which workers are executing tasks...
+    self.__busy_workers = self.__context.Array('b', size)
+    self.__workers = []
+    self.__supervisor_thread: threading.Thread = None
+
+  # starts a new worker process...
+  def __start_worker(self, worker_index: int):
+    maximum_task_count = self.__maximum_task_count + random.randint(0, max(0, self.__maximum_task_count_jitter))
+    worker = self.__context.Process(
+      target=execute_tasks,
+      args=(self.__task_queue, self.__worker_task_queues[worker_index], self.__busy_workers, worker_index, maximum_task_count, self.__maximum_resident_set_size),
+      daemon=True)
+    worker.start()
+
+    return worker
+
+  # replaces the workers that have stopped...
+  def __supervise_workers(self):
+    while self.__is_running:
+      # waits until any of the workers stops...
+      stopped_sentinels = multiprocessing.connection.wait([worker.sentinel for worker in self.__workers], timeout=WORKER_SUPERVISION_POLL_TIMEOUT_IN_SECONDS)
+
+      # workers stop on their own while the pool is being disposed...
+      if not self.__is_running:
+        break
+
+      for index, worker in enumerate(self.__workers):
+        if worker.sentinel not in stopped_sentinels:
+          continue
+
+        worker.join()
+
+        # workers that have stopped for any other reason are considered crashed...
+        reason = WORKER_RECYCLE_REASONS.get(worker.exitcode)
+        # a worker that has stopped while executing a task never clears its flag.
+        # NOTE: workers are only recycled between tasks so this can only
+        # happen if the worker has stopped for any other reason...
+        has_interrupted_task = self.__busy_workers[index] == 1
+        self.__busy_workers[index] = 0
+
+        self.__workers[index] = self.__start_worker(index)
+
+        if reason is None:
+          self.__metrics.increment('workerCrashes')
+          self.__logger.error(__file__, f'Worker {worker.pid} crashed with exit code {worker.exitcode} and has been replaced by worker {self.__workers[index].pid}.')
+        else:
+          self.__metrics.record_worker_recycle(reason)
+          self.__logger.information(__file__, f'Worker {worker.pid} has been recycled ({reason}) and replaced by worker {self.__workers[index].pid}...')
+
+        if not has_interrupted_task:
+          continue
+
+        # the worker held the only sending end of the result pipe which has been closed by
+        # the operating system. thus the requesting process receives end of file and fails
+        # the chunk instead of waiting for results that will never arrive...
+        self.__metrics.increment('interruptedTasks')
+        self.__logger.error(__file__, f'Worker {worker.pid} stopped while executing a task. The task has been failed back to the requesting process.')
+
+  # starts the worker processes...
+  def start(self):
+    self.__is_running = True
+
+    # NOTE: resident set size cannot be measured on some platforms (e.g. windows)...
+    if get_resident_set_size() == 0:
+      self.__logger.warning(__file__, 'Resident set size cannot be measured on this platform. Workers shall not be recycled based on memory usage.')
+
+    self.__logger.information(__file__, f'Starting {self.__size} workers that are recycled after {self.__maximum_task_count} (+{self.__maximum_task_count_jitter}) tasks or {self.__maximum_resident_set_size} bytes of resident set size...')
+
+    for index in range(self.__size):
+      self.__workers.append(self.__start_worker(index))
+
+    self.__supervisor_thread = threading.Thread(target=self.__supervise_workers, daemon=True)
+    self.__supervisor_thread.start()
+
+  # returns the queue on which tasks shall be placed...
+  def get_task_queue(self):
+    return self.__task_queue
+
+  # returns the queues (by worker index) on which tasks for specific workers shall be placed...
+  def get_worker_task_queues(self):
+    return self.__worker_task_queues
+
+  # returns the number of workers of the pool...
+  def get_size(self):
+    return self.__size
+
+  # returns the number of workers that are executing tasks...
+  def get_busy_worker_count(self):
+    return sum(self.__busy_workers)
+
+  # stops the worker processes...
+  def dispose(self):
+    self.__is_running = False
+
+    # no worker shall be replaced from now on...
+    if self.__supervisor_thread is not None:
+      self.__supervisor_thread.join()
+
+    # every worker receives its own signal to stop...
+    for worker_task_queue in self.__worker_task_queues:
+      worker_task_queue.put(None)
+
+    for worker in self.__workers:
+      worker.join(timeout=WORKER_JOIN_TIMEOUT_IN_SECONDS)
+
+    self.__workers.clear()
+    self.__task_queue.close()
+
+    for worker_task_queue in self.__worker_task_queues:
+      worker_task_queue.close()